@@ -6,14 +6,14 @@ import dataclasses
 
 from compta_ecom.config.loader import AppConfig
 from compta_ecom.engine import marketplace_entries
-from compta_ecom.engine.accounts import normalize_lettrage
+from compta_ecom.engine.accounts import NO_CHARGE_ACCOUNTS, normalize_lettrage
 from compta_ecom.engine.marketplace_payout_entries import (
     generate_marketplace_payout,
     generate_marketplace_payout_from_summary,
 )
 from compta_ecom.engine.payout_entries import generate_payout_entries
 from compta_ecom.engine.direct_payment_entries import generate_direct_payment_entries
-from compta_ecom.engine.sale_entries import generate_sale_entries
+from compta_ecom.engine.sale_entries import AccountCacheKey, generate_sale_entries
 from compta_ecom.engine.settlement_entries import generate_settlement_entries
 from compta_ecom.models import AccountingEntry, Anomaly, BalanceError, NormalizedTransaction, PayoutSummary
 
@@ -40,11 +40,24 @@ def generate_entries(
     entries: list[AccountingEntry] = []
     anomalies: list[Anomaly] = []
 
+    # Reversement unitaire 512 ↔ fournisseur : seulement pour les canaux
+    # qui n'ont pas de compte de charge commission (ces canaux utilisent
+    # les reversements agrégés 580 ↔ 411 via PayoutSummary à la place).
+    unit_payout_channels = {
+        channel
+        for channel in config.fournisseurs
+        if "commission" not in config.comptes_charges_marketplace.get(channel, NO_CHARGE_ACCOUNTS)
+    }
+
+    # Comptes de vente résolus une fois par (canal, pays, frais de port)
+    # pour toute la génération : quelques dizaines de combinaisons seulement.
+    sale_accounts: dict[AccountCacheKey, dict[str, str]] = {}
+
     for transaction in transactions:
         if transaction.special_type is not None:
             if transaction.special_type == "returns_avoir":
                 try:
-                    entries.extend(generate_sale_entries(transaction, config))
+                    entries.extend(generate_sale_entries(transaction, config, sale_accounts))
                 except BalanceError as exc:
                     anomalies.append(
                         Anomaly(
@@ -60,7 +73,7 @@ def generate_entries(
                 continue
             if transaction.special_type == "direct_payment":
                 try:
-                    entries.extend(generate_sale_entries(transaction, config))
+                    entries.extend(generate_sale_entries(transaction, config, sale_accounts))
                 except BalanceError as exc:
                     anomalies.append(
                         Anomaly(
@@ -82,7 +95,7 @@ def generate_entries(
                 entries.extend(generate_marketplace_payout(transaction, config))
             continue
         try:
-            entries.extend(generate_sale_entries(transaction, config))
+            entries.extend(generate_sale_entries(transaction, config, sale_accounts))
         except BalanceError as exc:
             anomalies.append(
                 Anomaly(
@@ -100,11 +113,7 @@ def generate_entries(
             entries.extend(
                 marketplace_entries.generate_marketplace_commission(transaction, config)
             )
-            # Reversement unitaire 512 ↔ fournisseur : seulement pour les canaux
-            # qui n'ont pas de compte de charge commission (ces canaux utilisent
-            # les reversements agrégés 580 ↔ 411 via PayoutSummary à la place).
-            charges_mp = config.comptes_charges_marketplace.get(transaction.channel, {})
-            if "commission" not in charges_mp:
+            if transaction.channel in unit_payout_channels:
                 entries.extend(generate_marketplace_payout(transaction, config))
         else:
             entries.extend(generate_settlement_entries(transaction, config))
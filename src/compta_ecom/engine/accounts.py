@@ -3,10 +3,17 @@
 from __future__ import annotations
 
 import dataclasses
+import datetime
 from collections import defaultdict
+from collections.abc import Mapping, Sequence
+from types import MappingProxyType
 
 from compta_ecom.models import AccountingEntry, BalanceError
 
+# Repli pour les canaux sans comptes_charges_marketplace (lecture seule).
+NO_CHARGE_ACCOUNTS: Mapping[str, str] = MappingProxyType({})
+
+
 def build_account(
     prefix: str, channel_code: str | None, country_code: str
 ) -> str:
@@ -58,13 +65,95 @@ def build_shipping_account(prefix: str, channel_code: str, zone_code: str) -> st
     return f"{prefix}{channel_code}{zone_code}"
 
 
-def verify_balance(entries: list[AccountingEntry]) -> None:
-    """Vérifie l'équilibre débit/crédit d'un ensemble d'écritures. Lève BalanceError si déséquilibre."""
-    total_debit = round(sum(e.debit for e in entries), 2)
-    total_credit = round(sum(e.credit for e in entries), 2)
+def to_cents(amount: float) -> int:
+    """Convertit un montant en euros en nombre entier de centimes.
+
+    Examples:
+        >>> to_cents(19.99)
+        1999
+        >>> to_cents(-0.1)
+        -10
+    """
+    return round(amount * 100)
+
+
+def split_signed(amount: float) -> tuple[float, float]:
+    """Répartit un montant signé en ``(débit, crédit)``.
+
+    Positif → débit, négatif → crédit (en valeur absolue). La ligne de
+    contrepartie s'obtient en inversant le couple.
+
+    Examples:
+        >>> split_signed(12.5)
+        (12.5, 0.0)
+        >>> split_signed(-3.2)
+        (0.0, 3.2)
+    """
+    if amount > 0:
+        return amount, 0.0
+    if amount < 0:
+        return 0.0, -amount
+    return 0.0, 0.0
+
+
+def build_transit_pair(
+    *,
+    date: datetime.date,
+    journal: str,
+    transit_account: str,
+    counterpart_account: str,
+    amount: float,
+    label: str,
+    piece_number: str,
+    channel: str,
+) -> list[AccountingEntry]:
+    """Construit la paire de reversement 580 ↔ contrepartie (PSP ou client).
+
+    ``amount > 0`` : transit au débit, contrepartie au crédit ; ``amount < 0`` :
+    sens inverse. La contrepartie est lettrée par ``piece_number``, la ligne
+    de transit ne l'est pas. Les deux lignes portent le même montant : la
+    paire est équilibrée par construction. ``amount`` ne doit pas être nul.
+    """
+    debit, credit = split_signed(amount)
+    return [
+        AccountingEntry(
+            date=date,
+            journal=journal,
+            account=transit_account,
+            label=label,
+            debit=debit,
+            credit=credit,
+            piece_number=piece_number,
+            lettrage="",
+            channel=channel,
+            entry_type="payout",
+        ),
+        AccountingEntry(
+            date=date,
+            journal=journal,
+            account=counterpart_account,
+            label=label,
+            debit=credit,
+            credit=debit,
+            piece_number=piece_number,
+            lettrage=piece_number,
+            channel=channel,
+            entry_type="payout",
+        ),
+    ]
+
+
+def verify_balance(entries: Sequence[AccountingEntry]) -> None:
+    """Vérifie l'équilibre débit/crédit d'un ensemble d'écritures. Lève BalanceError si déséquilibre.
+
+    Les totaux sont comparés en centimes entiers : la somme est exacte,
+    quel que soit le nombre de lignes.
+    """
+    total_debit = sum(to_cents(e.debit) for e in entries)
+    total_credit = sum(to_cents(e.credit) for e in entries)
     if total_debit != total_credit:
         raise BalanceError(
-            f"Déséquilibre écriture: débit={total_debit}, crédit={total_credit}"
+            f"Déséquilibre écriture: débit={total_debit / 100}, crédit={total_credit / 100}"
         )
 
 
@@ -3,14 +3,16 @@
 from __future__ import annotations
 
 from compta_ecom.config.loader import AppConfig
-from compta_ecom.engine.accounts import verify_balance
 from compta_ecom.models import AccountingEntry, NormalizedTransaction, channel_display_name
 
 
 def generate_direct_payment_entries(
     transaction: NormalizedTransaction, config: AppConfig
 ) -> list[AccountingEntry]:
-    """Génère 2 lignes RG : débit compte direct + crédit 411 client."""
+    """Génère 2 lignes RG : débit compte direct + crédit 411 client.
+
+    Les deux lignes portent le même montant (équilibre par construction).
+    """
     if transaction.payment_method is None:
         return []
 
@@ -53,5 +55,4 @@ def generate_direct_payment_entries(
         ),
     ]
 
-    verify_balance(entries)
     return entries
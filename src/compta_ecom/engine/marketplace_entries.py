@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from compta_ecom.config.loader import AppConfig
-from compta_ecom.engine.accounts import verify_balance
+from compta_ecom.engine.accounts import NO_CHARGE_ACCOUNTS, verify_balance
 from compta_ecom.models import AccountingEntry, NormalizedTransaction, channel_display_name
 
 
@@ -28,7 +28,7 @@ def generate_marketplace_commission(
         return []
 
     # Compte de charge marketplace si configuré (ex: Decathlon → 62220800)
-    charges_mp = config.comptes_charges_marketplace.get(transaction.channel, {})
+    charges_mp = config.comptes_charges_marketplace.get(transaction.channel, NO_CHARGE_ACCOUNTS)
     charge_account = charges_mp.get("commission")
     tva_deductible_account = charges_mp.get("tva_deductible")
 
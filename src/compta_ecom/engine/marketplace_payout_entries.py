@@ -5,7 +5,7 @@ from __future__ import annotations
 import logging
 
 from compta_ecom.config.loader import AppConfig
-from compta_ecom.engine.accounts import verify_balance
+from compta_ecom.engine.accounts import NO_CHARGE_ACCOUNTS, build_transit_pair, verify_balance
 from compta_ecom.models import AccountingEntry, NormalizedTransaction, PayoutSummary, channel_display_name
 
 logger = logging.getLogger(__name__)
@@ -26,30 +26,6 @@ _SPECIAL_TYPE_TO_CONFIG_KEY: dict[str, str] = {
 }
 
 
-def _resolve_payout_account(
-    transaction: NormalizedTransaction, config: AppConfig
-) -> str:
-    """Résout le compte de contrepartie pour le reversement.
-
-    Priorité :
-    1. special_type mappé vers comptes_charges_marketplace → compte de charge
-    2. special_type in comptes_speciaux → compte spécial
-    3. sinon → fournisseur
-    """
-    config_key = _SPECIAL_TYPE_TO_CONFIG_KEY.get(transaction.special_type or "")
-    if config_key is not None:
-        charges_mp = config.comptes_charges_marketplace.get(transaction.channel, {})
-        charge_account = charges_mp.get(config_key)
-        if charge_account is not None:
-            return charge_account
-    if (
-        transaction.special_type is not None
-        and transaction.special_type in config.comptes_speciaux
-    ):
-        return config.comptes_speciaux[transaction.special_type]
-    return config.fournisseurs[transaction.channel]
-
-
 def generate_marketplace_payout(
     transaction: NormalizedTransaction, config: AppConfig
 ) -> list[AccountingEntry]:
@@ -70,18 +46,31 @@ def generate_marketplace_payout(
     if net == 0.0:
         return []
 
-    account = _resolve_payout_account(transaction, config)
+    # Compte de contrepartie du reversement, par priorité :
+    # 1. special_type mappé vers comptes_charges_marketplace → compte de charge
+    # 2. special_type in comptes_speciaux → compte spécial
+    # 3. sinon → fournisseur
+    special_type = transaction.special_type
+    charges_mp = config.comptes_charges_marketplace.get(transaction.channel, NO_CHARGE_ACCOUNTS)
+    if special_type is None:
+        # Reversement régulier (cas majoritaire) : aucune table spéciale à consulter
+        config_key = None
+        label_prefix = "Reversement"
+    else:
+        config_key = _SPECIAL_TYPE_TO_CONFIG_KEY.get(special_type)
+        label_prefix = _SPECIAL_LABELS.get(special_type, "Reversement")
+    charge_account = charges_mp.get(config_key) if config_key is not None else None
+    has_charge_account = charge_account is not None
+    if charge_account is not None:
+        account = charge_account
+    elif special_type is not None and special_type in config.comptes_speciaux:
+        account = config.comptes_speciaux[special_type]
+    else:
+        account = config.fournisseurs[transaction.channel]
+
     canal_display = channel_display_name(transaction.channel)
-    label_prefix = _SPECIAL_LABELS.get(
-        transaction.special_type or "", "Reversement"
-    )
     label = f"{label_prefix} {transaction.reference} {canal_display}"
 
-    # Déterminer si le type spécial a un compte de charge configuré
-    charges_mp = config.comptes_charges_marketplace.get(transaction.channel, {})
-    config_key = _SPECIAL_TYPE_TO_CONFIG_KEY.get(transaction.special_type or "")
-    has_charge_account = config_key is not None and config_key in charges_mp
-
     if has_charge_account:
         entry_type = "fee"
         bank_or_client_account = config.clients[transaction.channel]
@@ -123,6 +112,11 @@ def generate_marketplace_payout(
             if channel_config and channel_config.commission_vat_rate:
                 fee_tva = round(amount * channel_config.commission_vat_rate / 100, 2)
 
+    # Champs communs à toutes les lignes de l'écriture, lus une fois
+    reference = transaction.reference
+    channel = transaction.channel
+
+    entries: list[AccountingEntry]
     if fee_tva > 0:
         # Abonnement avec TVA déductible : 3 écritures (charge HT + TVA + client TTC)
         ttc_amount = round(amount + fee_tva, 2)
@@ -137,9 +131,9 @@ def generate_marketplace_payout(
                     label=label,
                     debit=ttc_amount,
                     credit=0.0,
-                    piece_number=transaction.reference,
+                    piece_number=reference,
                     lettrage=client_ref,
-                    channel=transaction.channel,
+                    channel=channel,
                     entry_type=entry_type,
                 ),
                 AccountingEntry(
@@ -149,9 +143,9 @@ def generate_marketplace_payout(
                     label=label,
                     debit=0.0,
                     credit=amount,
-                    piece_number=transaction.reference,
+                    piece_number=reference,
                     lettrage="",
-                    channel=transaction.channel,
+                    channel=channel,
                     entry_type=entry_type,
                 ),
                 AccountingEntry(
@@ -161,9 +155,9 @@ def generate_marketplace_payout(
                     label=label,
                     debit=0.0,
                     credit=fee_tva,
-                    piece_number=transaction.reference,
+                    piece_number=reference,
                     lettrage="",
-                    channel=transaction.channel,
+                    channel=channel,
                     entry_type=entry_type,
                 ),
             ]
@@ -177,9 +171,9 @@ def generate_marketplace_payout(
                     label=label,
                     debit=amount,
                     credit=0.0,
-                    piece_number=transaction.reference,
+                    piece_number=reference,
                     lettrage="",
-                    channel=transaction.channel,
+                    channel=channel,
                     entry_type=entry_type,
                 ),
                 AccountingEntry(
@@ -189,9 +183,9 @@ def generate_marketplace_payout(
                     label=label,
                     debit=fee_tva,
                     credit=0.0,
-                    piece_number=transaction.reference,
+                    piece_number=reference,
                     lettrage="",
-                    channel=transaction.channel,
+                    channel=channel,
                     entry_type=entry_type,
                 ),
                 AccountingEntry(
@@ -201,9 +195,9 @@ def generate_marketplace_payout(
                     label=label,
                     debit=0.0,
                     credit=ttc_amount,
-                    piece_number=transaction.reference,
+                    piece_number=reference,
                     lettrage=client_ref,
-                    channel=transaction.channel,
+                    channel=channel,
                     entry_type=entry_type,
                 ),
             ]
@@ -217,7 +211,7 @@ def generate_marketplace_payout(
             credit_account = bank_or_client_account
 
         if has_charge_account:
-            client_account_val = config.clients[transaction.channel]
+            client_account_val = config.clients[channel]
             debit_lettrage = client_ref if debit_account == client_account_val else ""
             credit_lettrage = client_ref if credit_account == client_account_val else ""
         else:
@@ -232,9 +226,9 @@ def generate_marketplace_payout(
                 label=label,
                 debit=amount,
                 credit=0.0,
-                piece_number=transaction.reference,
+                piece_number=reference,
                 lettrage=debit_lettrage,
-                channel=transaction.channel,
+                channel=channel,
                 entry_type=entry_type,
             ),
             AccountingEntry(
@@ -244,9 +238,9 @@ def generate_marketplace_payout(
                 label=label,
                 debit=0.0,
                 credit=amount,
-                piece_number=transaction.reference,
+                piece_number=reference,
                 lettrage=credit_lettrage,
-                channel=transaction.channel,
+                channel=channel,
                 entry_type=entry_type,
             ),
         ]
@@ -273,7 +267,7 @@ def generate_marketplace_payout_from_summary(
 
     client_account = config.clients[payout.channel]
     transit_account = config.transit
-    date_str = payout.payout_date.strftime("%Y-%m-%d")
+    date_str = payout.payout_date.isoformat()
     label = f"Reversement {channel_display_name(payout.channel)} {date_str}"
     ref = payout.payout_reference or f"PAYOUT-{date_str}"
 
@@ -281,33 +275,13 @@ def generate_marketplace_payout_from_summary(
     # Donc abs(total) pour les écritures
     amount = round(abs(total), 2)
 
-    entries = [
-        AccountingEntry(
-            date=payout.payout_date,
-            journal=config.journal_reglement,
-            account=transit_account,
-            label=label,
-            debit=amount,
-            credit=0.0,
-            piece_number=ref,
-            lettrage="",
-            channel=payout.channel,
-            entry_type="payout",
-        ),
-        AccountingEntry(
-            date=payout.payout_date,
-            journal=config.journal_reglement,
-            account=client_account,
-            label=label,
-            debit=0.0,
-            credit=amount,
-            piece_number=ref,
-            lettrage=ref,
-            channel=payout.channel,
-            entry_type="payout",
-        ),
-    ]
-
-    verify_balance(entries)
-
-    return entries
+    return build_transit_pair(
+        date=payout.payout_date,
+        journal=config.journal_reglement,
+        transit_account=transit_account,
+        counterpart_account=client_account,
+        amount=amount,
+        label=label,
+        piece_number=ref,
+        channel=payout.channel,
+    )
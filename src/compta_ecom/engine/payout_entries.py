@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from compta_ecom.config.loader import AppConfig
-from compta_ecom.engine.accounts import verify_balance
+from compta_ecom.engine.accounts import build_transit_pair
 from compta_ecom.models import AccountingEntry, Anomaly, PayoutSummary
 
 
@@ -16,6 +16,9 @@ def generate_payout_entries(
     pour le versement entier, avec lettrage = payout_reference.
     Les fichiers detail servent uniquement à détecter les refunds
     manquants (logique parser, pas engine).
+
+    Chaque paire 580/511 est construite à partir d'un seul montant : elle
+    est équilibrée par construction et n'est pas repassée à verify_balance.
     """
     return _generate_aggregated_payout_entries(payout, config)
 
@@ -31,25 +34,26 @@ def _generate_aggregated_payout_entries(
         # Cross-period payout: no matched transactions in current dataset → info severity
         # True mixed PSP (transactions present but heterogeneous without breakdown) → warning
         is_cross_period = payout.matched_net_sum is None
-        payout_ref_display = payout.payout_reference or f"du {payout.payout_date.isoformat()}"
+        date_str = payout.payout_date.isoformat()
+        payout_ref_display = payout.payout_reference or f"du {date_str}"
         payout_amount = round(payout.total_amount, 2)
         anomaly = Anomaly(
             type="mixed_psp_payout",
             severity="info" if is_cross_period else "warning",
-            reference=payout.payout_reference or f"PAYOUT-{payout.payout_date.isoformat()}",
+            reference=payout.payout_reference or f"PAYOUT-{date_str}",
             channel=payout.channel,
             detail=(
                 f"Versement {payout_ref_display} de {payout_amount}EUR "
-                f"(date : {payout.payout_date.isoformat()}) sans aucune transaction "
+                f"(date : {date_str}) sans aucune transaction "
                 f"correspondante dans la période exportée — probable versement couvrant "
                 f"une période différente de celle des fichiers importés"
                 if is_cross_period
                 else f"Versement {payout_ref_display} de {payout_amount}EUR "
-                f"(date : {payout.payout_date.isoformat()}) contient plusieurs moyens "
+                f"(date : {date_str}) contient plusieurs moyens "
                 f"de paiement différents — l'écriture de reversement devra être saisie manuellement"
             ),
             expected_value="transactions correspondantes dans la période" if is_cross_period else "un seul moyen de paiement",
-            actual_value=f"{payout_amount}EUR le {payout.payout_date.isoformat()}",
+            actual_value=f"{payout_amount}EUR le {date_str}",
         )
         return [], [anomaly]
 
@@ -60,38 +64,21 @@ def _generate_aggregated_payout_entries(
     psp_cfg = config.psp[payout.psp_type]
     psp_account = psp_cfg.compte_intermediaire or psp_cfg.compte
     transit_account = config.transit
-    date_str = payout.payout_date.strftime("%Y-%m-%d")
+    date_str = payout.payout_date.isoformat()
     label = f"Reversement {payout.psp_type} {date_str}"
     ref = payout.payout_reference or f"PAYOUT-{date_str}"
 
-    entries = [
-        AccountingEntry(
-            date=payout.payout_date,
-            journal=config.journal_reglement,
-            account=transit_account,
-            label=label,
-            debit=total if total > 0 else 0.0,
-            credit=abs(total) if total < 0 else 0.0,
-            piece_number=ref,
-            lettrage="",
-            channel=payout.channel,
-            entry_type="payout",
-        ),
-        AccountingEntry(
-            date=payout.payout_date,
-            journal=config.journal_reglement,
-            account=psp_account,
-            label=label,
-            debit=abs(total) if total < 0 else 0.0,
-            credit=total if total > 0 else 0.0,
-            piece_number=ref,
-            lettrage=ref,
-            channel=payout.channel,
-            entry_type="payout",
-        ),
-    ]
+    entries = build_transit_pair(
+        date=payout.payout_date,
+        journal=config.journal_reglement,
+        transit_account=transit_account,
+        counterpart_account=psp_account,
+        amount=total,
+        label=label,
+        piece_number=ref,
+        channel=payout.channel,
+    )
 
-    verify_balance(entries)
     return entries, []
 
 
@@ -102,7 +89,8 @@ def _generate_aggregated_multi_psp_entries(
     entries: list[AccountingEntry] = []
     anomalies: list[Anomaly] = []
     transit_account = config.transit
-    date_str = payout.payout_date.strftime("%Y-%m-%d")
+    journal = config.journal_reglement
+    date_str = payout.payout_date.isoformat()
     ref = payout.payout_reference or f"PAYOUT-{date_str}"
 
     for psp_type, net in payout.psp_amounts.items():  # type: ignore[union-attr]
@@ -128,34 +116,17 @@ def _generate_aggregated_multi_psp_entries(
         psp_account = psp_cfg.compte_intermediaire or psp_cfg.compte
         label = f"Reversement {psp_type} {date_str}"
 
-        pair = [
-            AccountingEntry(
-                date=payout.payout_date,
-                journal=config.journal_reglement,
-                account=transit_account,
-                label=label,
-                debit=amount if amount > 0 else 0.0,
-                credit=abs(amount) if amount < 0 else 0.0,
-                piece_number=ref,
-                lettrage="",
-                channel=payout.channel,
-                entry_type="payout",
-            ),
-            AccountingEntry(
+        entries.extend(
+            build_transit_pair(
                 date=payout.payout_date,
-                journal=config.journal_reglement,
-                account=psp_account,
+                journal=journal,
+                transit_account=transit_account,
+                counterpart_account=psp_account,
+                amount=amount,
                 label=label,
-                debit=abs(amount) if amount < 0 else 0.0,
-                credit=amount if amount > 0 else 0.0,
                 piece_number=ref,
-                lettrage=ref,
                 channel=payout.channel,
-                entry_type="payout",
-            ),
-        ]
-
-        verify_balance(pair)
-        entries.extend(pair)
+            )
+        )
 
     return entries, anomalies
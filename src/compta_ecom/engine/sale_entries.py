@@ -12,11 +12,28 @@ from compta_ecom.engine.accounts import (
 from compta_ecom.models import AccountingEntry, NormalizedTransaction, channel_display_name
 
 
+# Clé du cache de comptes : (canal, pays, présence de frais de port)
+AccountCacheKey = tuple[str, str, bool]
+
+
 def generate_sale_entries(
-    transaction: NormalizedTransaction, config: AppConfig
+    transaction: NormalizedTransaction,
+    config: AppConfig,
+    account_cache: dict[AccountCacheKey, dict[str, str]] | None = None,
 ) -> list[AccountingEntry]:
-    """Génère les écritures de vente ou d'avoir pour une transaction."""
-    accounts = _resolve_accounts(transaction, config)
+    """Génère les écritures de vente ou d'avoir pour une transaction.
+
+    *account_cache* (optionnel) mémorise les comptes résolus par
+    ``(canal, pays, frais de port)`` ; il est créé par l'appelant pour la
+    durée d'une génération, la configuration ne devant pas changer entre-temps.
+    """
+    if account_cache is None:
+        accounts = _resolve_accounts(transaction, config)
+    else:
+        key = (transaction.channel, transaction.country_code, transaction.shipping_ht != 0.0)
+        if key not in account_cache:
+            account_cache[key] = _resolve_accounts(transaction, config)
+        accounts = account_cache[key]
     amounts = _compute_amounts(transaction)
     # Marketplaces : lettrage client par cycle de paiement (payout_reference)
     # pour que toutes les écritures 411 d'un même versement partagent le même lettrage.
@@ -52,11 +69,12 @@ def _resolve_accounts(
 
 
 def _compute_amounts(transaction: NormalizedTransaction) -> dict[str, float]:
+    """Montants arrondis au centime, une seule fois pour toutes les lignes."""
     return {
         "ht": round(transaction.amount_ht, 2),
         "shipping_ht": round(transaction.shipping_ht, 2),
         "tva": round(transaction.amount_tva + transaction.shipping_tva, 2),
-        "ttc": transaction.amount_ttc,
+        "ttc": round(transaction.amount_ttc, 2),
     }
 
 
@@ -78,10 +96,10 @@ def _build_entries(
     if not is_sale and transaction.channel == "shopify":
         piece_ref = f"{transaction.reference}A"
 
-    ttc = round(amounts["ttc"], 2)
-    ht = round(amounts["ht"], 2)
-    shipping_ht = round(amounts["shipping_ht"], 2)
-    tva = round(amounts["tva"], 2)
+    ttc = amounts["ttc"]
+    ht = amounts["ht"]
+    shipping_ht = amounts["shipping_ht"]
+    tva = amounts["tva"]
 
     entries: list[AccountingEntry] = []
 
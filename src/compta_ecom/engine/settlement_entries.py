@@ -3,14 +3,19 @@
 from __future__ import annotations
 
 from compta_ecom.config.loader import AppConfig
-from compta_ecom.engine.accounts import verify_balance
+from compta_ecom.engine.accounts import split_signed
 from compta_ecom.models import AccountingEntry, NormalizedTransaction, channel_display_name
 
 
 def generate_settlement_entries(
     transaction: NormalizedTransaction, config: AppConfig
 ) -> list[AccountingEntry]:
-    """Génère les écritures de règlement/commission pour une transaction PSP."""
+    """Génère les écritures de règlement/commission pour une transaction PSP.
+
+    Chaque ligne a sa contrepartie de même montant en sens inverse (couple
+    ``split_signed`` inversé) : l'écriture est équilibrée par construction
+    et n'est pas repassée à verify_balance.
+    """
     if transaction.payment_method is None:
         return []
 
@@ -40,6 +45,17 @@ def generate_settlement_entries(
     entries: list[AccountingEntry] = []
     intermed = psp_config.compte_intermediaire
     payout_ref = transaction.payout_reference or ""
+    # Champs communs à toutes les lignes, lus une fois
+    entry_date = transaction.date
+    reference = transaction.reference
+    channel = transaction.channel
+    journal_reglement = config.journal_reglement
+    journal_achats = config.journal_achats
+    # Sens débit/crédit de chaque montant, calculé une fois ; la ligne de
+    # contrepartie utilise le couple inversé.
+    total_debit, total_credit = split_signed(total_411)
+    commission_debit, commission_credit = split_signed(commission)
+    net_debit, net_credit = split_signed(net)
 
     if intermed is not None:
         # Flux 4 lignes avec compte intermédiaire (46710001)
@@ -47,29 +63,29 @@ def generate_settlement_entries(
         if total_411 != 0.0:
             entries.append(
                 AccountingEntry(
-                    date=transaction.date,
-                    journal=config.journal_reglement,
+                    date=entry_date,
+                    journal=journal_reglement,
                     account=intermed,
                     label=label,
-                    debit=total_411 if total_411 > 0 else 0.0,
-                    credit=abs(total_411) if total_411 < 0 else 0.0,
-                    piece_number=transaction.reference,
+                    debit=total_debit,
+                    credit=total_credit,
+                    piece_number=reference,
                     lettrage=payout_ref,
-                    channel=transaction.channel,
+                    channel=channel,
                     entry_type="settlement",
                 )
             )
             entries.append(
                 AccountingEntry(
-                    date=transaction.date,
-                    journal=config.journal_reglement,
+                    date=entry_date,
+                    journal=journal_reglement,
                     account=client_account,
                     label=label,
-                    debit=abs(total_411) if total_411 < 0 else 0.0,
-                    credit=total_411 if total_411 > 0 else 0.0,
-                    piece_number=transaction.reference,
-                    lettrage=transaction.reference,
-                    channel=transaction.channel,
+                    debit=total_credit,
+                    credit=total_debit,
+                    piece_number=reference,
+                    lettrage=reference,
+                    channel=channel,
                     entry_type="settlement",
                 )
             )
@@ -79,29 +95,29 @@ def generate_settlement_entries(
         if commission != 0.0:
             entries.append(
                 AccountingEntry(
-                    date=transaction.date,
-                    journal=config.journal_achats,
+                    date=entry_date,
+                    journal=journal_achats,
                     account=commission_account,
                     label=commission_label,
-                    debit=commission if commission > 0 else 0.0,
-                    credit=abs(commission) if commission < 0 else 0.0,
-                    piece_number=transaction.reference,
+                    debit=commission_debit,
+                    credit=commission_credit,
+                    piece_number=reference,
                     lettrage="",
-                    channel=transaction.channel,
+                    channel=channel,
                     entry_type="commission",
                 )
             )
             entries.append(
                 AccountingEntry(
-                    date=transaction.date,
-                    journal=config.journal_achats,
+                    date=entry_date,
+                    journal=journal_achats,
                     account=intermed,
                     label=commission_label,
-                    debit=abs(commission) if commission < 0 else 0.0,
-                    credit=commission if commission > 0 else 0.0,
-                    piece_number=transaction.reference,
+                    debit=commission_credit,
+                    credit=commission_debit,
+                    piece_number=reference,
                     lettrage=payout_ref,
-                    channel=transaction.channel,
+                    channel=channel,
                     entry_type="commission",
                 )
             )
@@ -111,15 +127,15 @@ def generate_settlement_entries(
         if net != 0.0:
             entries.append(
                 AccountingEntry(
-                    date=transaction.date,
-                    journal=config.journal_reglement,
+                    date=entry_date,
+                    journal=journal_reglement,
                     account=psp_config.compte,
                     label=label,
-                    debit=net if net > 0 else 0.0,
-                    credit=abs(net) if net < 0 else 0.0,
-                    piece_number=transaction.reference,
+                    debit=net_debit,
+                    credit=net_credit,
+                    piece_number=reference,
                     lettrage=payout_ref,
-                    channel=transaction.channel,
+                    channel=channel,
                     entry_type="settlement",
                 )
             )
@@ -129,15 +145,15 @@ def generate_settlement_entries(
         if commission != 0.0:
             entries.append(
                 AccountingEntry(
-                    date=transaction.date,
-                    journal=config.journal_achats,
+                    date=entry_date,
+                    journal=journal_achats,
                     account=commission_account,
                     label=commission_label,
-                    debit=commission if commission > 0 else 0.0,
-                    credit=abs(commission) if commission < 0 else 0.0,
-                    piece_number=transaction.reference,
+                    debit=commission_debit,
+                    credit=commission_credit,
+                    piece_number=reference,
                     lettrage="",
-                    channel=transaction.channel,
+                    channel=channel,
                     entry_type="commission",
                 )
             )
@@ -147,15 +163,15 @@ def generate_settlement_entries(
         if net != 0.0:
             entries.append(
                 AccountingEntry(
-                    date=transaction.date,
-                    journal=config.journal_reglement,
+                    date=entry_date,
+                    journal=journal_reglement,
                     account=client_account,
                     label=label,
-                    debit=abs(net) if net < 0 else 0.0,
-                    credit=net if net > 0 else 0.0,
-                    piece_number=transaction.reference,
-                    lettrage=transaction.reference,
-                    channel=transaction.channel,
+                    debit=net_credit,
+                    credit=net_debit,
+                    piece_number=reference,
+                    lettrage=reference,
+                    channel=channel,
                     entry_type="settlement",
                 )
             )
@@ -163,20 +179,17 @@ def generate_settlement_entries(
         if commission != 0.0:
             entries.append(
                 AccountingEntry(
-                    date=transaction.date,
-                    journal=config.journal_achats,
+                    date=entry_date,
+                    journal=journal_achats,
                     account=client_account,
                     label=commission_label,
-                    debit=abs(commission) if commission < 0 else 0.0,
-                    credit=commission if commission > 0 else 0.0,
-                    piece_number=transaction.reference,
-                    lettrage=transaction.reference,
-                    channel=transaction.channel,
+                    debit=commission_credit,
+                    credit=commission_debit,
+                    piece_number=reference,
+                    lettrage=reference,
+                    channel=channel,
                     entry_type="commission",
                 )
             )
 
-    if entries:
-        verify_balance(entries)
-
     return entries
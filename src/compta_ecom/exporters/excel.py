@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 from collections import Counter
+from collections.abc import Iterable
 from io import BytesIO
+from operator import attrgetter
 from pathlib import Path
 
 import pandas as pd
+import xlsxwriter
 
 from compta_ecom.config.loader import AppConfig
 from compta_ecom.models import AccountingEntry, Anomaly
@@ -34,6 +37,24 @@ ANOMALIES_COLUMNS = [
     "actual_value",
 ]
 
+# Options du classeur xlsxwriter : les lignes sont écrites dans l'ordre et
+# flushées au fil de l'eau (mémoire constante) ; les dates au format ISO,
+# comme le faisait pandas.to_excel. Les textes sont écrits tels quels :
+# pas de conversion en lien hypertexte ni en formule.
+_WORKBOOK_OPTIONS = {
+    "constant_memory": True,
+    "default_date_format": "YYYY-MM-DD",
+    "strings_to_urls": False,
+    "strings_to_formulas": False,
+}
+
+# Extraction des champs dans l'ordre des colonnes exportées
+_ENTRY_FIELDS = attrgetter(*ENTRIES_COLUMNS)
+_ANOMALY_FIELDS = attrgetter(*ANOMALIES_COLUMNS)
+
+# Types d'écriture comptés comme transactions dans le résumé console
+_TX_ENTRY_TYPES = frozenset(("sale", "refund"))
+
 
 def export(
     entries: list[AccountingEntry],
@@ -42,79 +63,42 @@ def export(
     config: AppConfig,
 ) -> None:
     """Exporte les écritures et anomalies dans un fichier Excel multi-onglets."""
-    entries_data = [
-        {
-            "date": e.date,
-            "journal": e.journal,
-            "account": e.account,
-            "label": e.label,
-            "debit": e.debit,
-            "credit": e.credit,
-            "piece_number": e.piece_number,
-            "lettrage": e.lettrage,
-            "channel": e.channel,
-            "entry_type": e.entry_type,
-        }
-        for e in entries
-    ]
-    df_entries = pd.DataFrame(entries_data, columns=ENTRIES_COLUMNS)
-
-    anomalies_data = [
-        {
-            "type": a.type,
-            "severity": a.severity,
-            "reference": a.reference,
-            "channel": a.channel,
-            "detail": a.detail,
-            "expected_value": a.expected_value,
-            "actual_value": a.actual_value,
-        }
-        for a in anomalies
-    ]
-    df_anomalies = pd.DataFrame(anomalies_data, columns=ANOMALIES_COLUMNS)
-
-    with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
-        df_entries.to_excel(writer, sheet_name="Écritures", index=False)
-        df_anomalies.to_excel(writer, sheet_name="Anomalies", index=False)
-
-
-def _build_dataframes(
+    _write_workbook(str(output_path), entries, anomalies)
+
+
+def _write_workbook(
+    target: str | BytesIO,
     entries: list[AccountingEntry],
     anomalies: list[Anomaly],
-) -> tuple[pd.DataFrame, pd.DataFrame]:
-    """Construit les DataFrames écritures et anomalies."""
-    entries_data = [
-        {
-            "date": e.date,
-            "journal": e.journal,
-            "account": e.account,
-            "label": e.label,
-            "debit": e.debit,
-            "credit": e.credit,
-            "piece_number": e.piece_number,
-            "lettrage": e.lettrage,
-            "channel": e.channel,
-            "entry_type": e.entry_type,
-        }
-        for e in entries
-    ]
-    df_entries = pd.DataFrame(entries_data, columns=ENTRIES_COLUMNS)
-
-    anomalies_data = [
-        {
-            "type": a.type,
-            "severity": a.severity,
-            "reference": a.reference,
-            "channel": a.channel,
-            "detail": a.detail,
-            "expected_value": a.expected_value,
-            "actual_value": a.actual_value,
-        }
-        for a in anomalies
-    ]
-    df_anomalies = pd.DataFrame(anomalies_data, columns=ANOMALIES_COLUMNS)
-
-    return df_entries, df_anomalies
+) -> None:
+    """Écrit les onglets Écritures et Anomalies ligne à ligne, sans DataFrame."""
+    workbook = xlsxwriter.Workbook(target, _WORKBOOK_OPTIONS)
+    _write_sheet(workbook, "Écritures", ENTRIES_COLUMNS, map(_ENTRY_FIELDS, entries))
+    _write_sheet(workbook, "Anomalies", ANOMALIES_COLUMNS, map(_ANOMALY_FIELDS, anomalies))
+    workbook.close()
+
+
+def _write_sheet(
+    workbook: xlsxwriter.Workbook,
+    name: str,
+    columns: list[str],
+    rows: Iterable[tuple[object, ...]],
+) -> None:
+    """Écrit un onglet : ligne d'en-tête puis une ligne par tuple de valeurs."""
+    worksheet = workbook.add_worksheet(name)
+    worksheet.write_row(0, 0, columns)
+    for row_index, values in enumerate(rows, start=1):
+        worksheet.write_row(row_index, 0, values)
+
+
+def _entries_dataframe(entries: list[AccountingEntry]) -> pd.DataFrame:
+    """Construit le DataFrame des écritures à partir d'un tuple de champs par ligne."""
+    return pd.DataFrame(list(map(_ENTRY_FIELDS, entries)), columns=ENTRIES_COLUMNS)
+
+
+def _anomalies_dataframe(anomalies: list[Anomaly]) -> pd.DataFrame:
+    """Construit le DataFrame des anomalies à partir d'un tuple de champs par ligne."""
+    return pd.DataFrame(list(map(_ANOMALY_FIELDS, anomalies)), columns=ANOMALIES_COLUMNS)
 
 
 def export_to_bytes(
@@ -123,34 +107,15 @@ def export_to_bytes(
     config: AppConfig,
 ) -> BytesIO:
     """Exporte les écritures et anomalies dans un fichier Excel en mémoire."""
-    df_entries, df_anomalies = _build_dataframes(entries, anomalies)
-
     buffer = BytesIO()
-    with pd.ExcelWriter(buffer, engine="openpyxl") as writer:
-        df_entries.to_excel(writer, sheet_name="Écritures", index=False)
-        df_anomalies.to_excel(writer, sheet_name="Anomalies", index=False)
+    _write_workbook(buffer, entries, anomalies)
     buffer.seek(0)
     return buffer
 
 
 def export_csv_to_bytes(entries: list[AccountingEntry]) -> BytesIO:
     """Exporte les écritures en CSV (UTF-8 BOM) en mémoire."""
-    entries_data = [
-        {
-            "date": e.date,
-            "journal": e.journal,
-            "account": e.account,
-            "label": e.label,
-            "debit": e.debit,
-            "credit": e.credit,
-            "piece_number": e.piece_number,
-            "lettrage": e.lettrage,
-            "channel": e.channel,
-            "entry_type": e.entry_type,
-        }
-        for e in entries
-    ]
-    df = pd.DataFrame(entries_data, columns=ENTRIES_COLUMNS)
+    df = _entries_dataframe(entries)
     buffer = BytesIO()
     df.to_csv(buffer, index=False, encoding="utf-8-sig", sep=";")
     buffer.seek(0)
@@ -159,19 +124,7 @@ def export_csv_to_bytes(entries: list[AccountingEntry]) -> BytesIO:
 
 def export_anomalies_csv_to_bytes(anomalies: list[Anomaly]) -> BytesIO:
     """Exporte les anomalies en CSV (UTF-8 BOM) en mémoire."""
-    anomalies_data = [
-        {
-            "type": a.type,
-            "severity": a.severity,
-            "reference": a.reference,
-            "channel": a.channel,
-            "detail": a.detail,
-            "expected_value": a.expected_value,
-            "actual_value": a.actual_value,
-        }
-        for a in anomalies
-    ]
-    df = pd.DataFrame(anomalies_data, columns=ANOMALIES_COLUMNS)
+    df = _anomalies_dataframe(anomalies)
     buffer = BytesIO()
     df.to_csv(buffer, index=False, encoding="utf-8-sig", sep=";")
     buffer.seek(0)
@@ -184,15 +137,9 @@ def print_summary(
     channel_errors: list[tuple[str, str]],
 ) -> None:
     """Affiche un résumé en console."""
-    # Transactions par canal (sale + refund uniquement)
-    tx_entries = [e for e in entries if e.entry_type in ("sale", "refund")]
-    tx_by_channel: Counter[str] = Counter()
-    refs_seen: set[tuple[str, str]] = set()
-    for e in tx_entries:
-        key = (e.channel, e.piece_number)
-        if key not in refs_seen:
-            refs_seen.add(key)
-            tx_by_channel[e.channel] += 1
+    # Transactions par canal (sale + refund uniquement, une par pièce)
+    tx_refs = {(e.channel, e.piece_number) for e in entries if e.entry_type in _TX_ENTRY_TYPES}
+    tx_by_channel = Counter(channel for channel, _ in tx_refs)
 
     print("=== Résumé ===")
     print(f"Transactions traitées : {sum(tx_by_channel.values())}")
@@ -205,42 +152,33 @@ def print_summary(
     for entry_type, count in sorted(type_counts.items()):
         print(f"  {entry_type} : {count}")
 
-    # Anomalies
-    n_serious = len([a for a in anomalies if a.severity != "info"])
-    n_info = len([a for a in anomalies if a.severity == "info"])
+    # Anomalies : un seul parcours pour les compteurs de sévérité et les
+    # ventilations par type et par canal (Counter conserve l'ordre d'apparition)
+    n_info = 0
+    type_counts_anom: Counter[str] = Counter()
+    type_severity: dict[str, str] = {}
+    channel_counts: Counter[str] = Counter()
+    for a in anomalies:
+        if a.severity == "info":
+            n_info += 1
+        type_severity.setdefault(a.type, a.severity)
+        type_counts_anom[a.type] += 1
+        channel_counts[a.channel] += 1
+    n_serious = len(anomalies) - n_info
 
     if not anomalies:
         print("Aucune anomalie détectée")
     else:
         print(f"Anomalies : {n_serious} warning/error, {n_info} info")
 
-        # Ventilation par type (ordre d'apparition)
-        type_order: list[str] = []
-        type_counts_anom: Counter[str] = Counter()
-        type_severity: dict[str, str] = {}
-        for a in anomalies:
-            if a.type not in type_severity:
-                type_order.append(a.type)
-                type_severity[a.type] = a.severity
-            type_counts_anom[a.type] += 1
-
         print("  Par type :")
-        for anom_type in type_order:
-            count = type_counts_anom[anom_type]
+        for anom_type, count in type_counts_anom.items():
             suffix = "  (info)" if type_severity[anom_type] == "info" else ""
             print(f"    {anom_type:<20s}: {count}{suffix}")
 
-        # Ventilation par canal (ordre d'apparition)
-        channel_order: list[str] = []
-        channel_counts: Counter[str] = Counter()
-        for a in anomalies:
-            if a.channel not in channel_counts:
-                channel_order.append(a.channel)
-            channel_counts[a.channel] += 1
-
         print("  Par canal :")
-        for chan in channel_order:
-            print(f"    {chan:<20s}: {channel_counts[chan]}")
+        for chan, count in channel_counts.items():
+            print(f"    {chan:<20s}: {count}")
 
     # Canaux en erreur
     if channel_errors:
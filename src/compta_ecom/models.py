@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import datetime
+import functools
 from dataclasses import dataclass
 
 
@@ -29,10 +30,10 @@ class NoResultError(ComptaEcomError):
     """Aucun canal n'a produit de résultat."""
 
 
-# --- Dataclasses métier (frozen) ---
+# --- Dataclasses métier (frozen, slots) ---
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NormalizedTransaction:
     """Transaction normalisée issue du parsing CSV."""
 
@@ -56,7 +57,7 @@ class NormalizedTransaction:
     special_type: str | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AccountingEntry:
     """Unité atomique de l'export Excel."""
 
@@ -72,7 +73,7 @@ class AccountingEntry:
     entry_type: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Anomaly:
     """Anomalie détectée lors du traitement."""
 
@@ -85,7 +86,7 @@ class Anomaly:
     actual_value: str | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PayoutSummary:
     """Résumé d'un versement PSP."""
 
@@ -103,7 +104,7 @@ class PayoutSummary:
     matched_net_sum: float | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PayoutDetail:
     """Ligne individuelle d'un versement : une transaction dans un batch de payout."""
 
@@ -143,6 +144,11 @@ _CHANNEL_DISPLAY_NAMES: dict[str, str] = {
 }
 
 
+@functools.cache
 def channel_display_name(channel: str) -> str:
-    """Retourne le nom d'affichage du canal."""
+    """Retourne le nom d'affichage du canal.
+
+    Mis en cache : appelé pour chaque libellé d'écriture, sur un petit
+    nombre de canaux distincts.
+    """
     return _CHANNEL_DISPLAY_NAMES.get(channel, channel.replace("_", " ").title())
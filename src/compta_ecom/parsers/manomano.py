@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import Any
 
 import pandas as pd
+from pandas.api.types import is_datetime64_any_dtype
 
 from compta_ecom.config.loader import AppConfig
 from compta_ecom.models import Anomaly, NormalizedTransaction, ParseError, ParseResult, PayoutSummary
@@ -46,6 +47,9 @@ KNOWN_PAYOUT_TYPES = {
     "ORDER", "REFUND", "ADJUSTMENT", "ECO_CONTRIBUTION",
     "ECO_CONTRIBUTION_SERVICE", "SUBSCRIPTION", "REFUND_PENALTY",
 }
+# Liste affichée dans les anomalies unknown_payout_type
+KNOWN_PAYOUT_TYPES_DISPLAY = ", ".join(sorted(KNOWN_PAYOUT_TYPES))
+ORDER_REFUND_TYPES = {"ORDER", "REFUND"}
 SPECIAL_TYPES = {
     "ADJUSTMENT", "ECO_CONTRIBUTION", "ECO_CONTRIBUTION_SERVICE",
     "SUBSCRIPTION", "REFUND_PENALTY",
@@ -60,6 +64,11 @@ PAYOUT_COLUMN_ALIASES: dict[str, list[str]] = {
     "AMOUNT_HT": ["AMOUNT_VAT_EXCL"],
 }
 
+# Colonnes lues dans les exports (attendues + alias) : les autres colonnes
+# des exports réels ne sont pas parsées (usecols)
+CA_USECOLS = frozenset(CA_REQUIRED_COLUMNS).union(*CA_COLUMN_ALIASES.values())
+PAYOUT_USECOLS = frozenset(PAYOUT_REQUIRED_COLUMNS).union(PAYOUT_COLUMN_ALIASES, *PAYOUT_COLUMN_ALIASES.values())
+
 ORDER_DETAILS_REQUIRED_COLUMNS = ["Order Reference", "Billing Country ISO"]
 
 CA_AMOUNT_COLUMNS = [
@@ -104,8 +113,12 @@ class ManoManoParser(BaseParser):
         # Detect country conflicts before deduplication
         grouped = df.groupby("Order Reference")["Billing Country ISO"].nunique()
         conflict_refs = grouped[grouped > 1].index
-        for ref in conflict_refs:
-            values = df.loc[df["Order Reference"] == ref, "Billing Country ISO"].unique().tolist()
+        # Valeurs distinctes (ordre d'apparition) des seules commandes en conflit,
+        # en un groupby plutôt qu'un masque sur tout le fichier par commande
+        conflicts = df[df["Order Reference"].isin(conflict_refs)]
+        conflict_values = conflicts.groupby("Order Reference")["Billing Country ISO"].unique()
+        for ref, unique_values in conflict_values.items():
+            values = unique_values.tolist()
             anomalies.append(Anomaly(
                 type="country_conflict",
                 severity="warning",
@@ -120,13 +133,19 @@ class ManoManoParser(BaseParser):
         # Deduplicate: keep first occurrence per Order Reference
         deduped = df.drop_duplicates(subset=["Order Reference"], keep="first")
 
-        lookup: dict[str, str] = {}
-        for _, row in deduped.iterrows():
-            ref = str(row["Order Reference"])
-            alpha2_raw = row["Billing Country ISO"]
+        # Normalisation et résolution alpha-2 → numérique en colonne ;
+        # seules les lignes en anomalie repassent par une boucle Python.
+        refs = deduped["Order Reference"].map(str)
+        countries = deduped["Billing Country ISO"]
+        alpha2 = countries.where(countries.notna(), "").astype(str).str.strip().str.upper()
+        numeric = alpha2.map(config.alpha2_to_numeric)
+        resolved = numeric.notna()
+
+        lookup: dict[str, str] = dict(zip(refs[resolved].tolist(), numeric[resolved].tolist()))
 
+        for ref, alpha2_upper in zip(refs[~resolved].tolist(), alpha2[~resolved].tolist()):
             # Empty/NaN check
-            if pd.isna(alpha2_raw) or str(alpha2_raw).strip() == "":
+            if alpha2_upper == "":
                 anomalies.append(Anomaly(
                     type="missing_country_iso",
                     severity="warning",
@@ -139,23 +158,16 @@ class ManoManoParser(BaseParser):
                 logger.warning("Billing Country ISO vide pour %s", ref)
                 continue
 
-            alpha2_upper = str(alpha2_raw).strip().upper()
-            numeric_code = config.alpha2_to_numeric.get(alpha2_upper)
-
-            if numeric_code is None:
-                anomalies.append(Anomaly(
-                    type="unknown_country_alpha2",
-                    severity="warning",
-                    reference=ref,
-                    channel="manomano",
-                    detail=f"Code alpha-2 « {alpha2_upper} » absent de la table TVA",
-                    expected_value="Code alpha-2 connu (FR, DE, IT…)",
-                    actual_value=alpha2_upper,
-                ))
-                logger.warning("Alpha-2 inconnu pour %s : %s", ref, alpha2_upper)
-                continue
-
-            lookup[ref] = numeric_code
+            anomalies.append(Anomaly(
+                type="unknown_country_alpha2",
+                severity="warning",
+                reference=ref,
+                channel="manomano",
+                detail=f"Code alpha-2 « {alpha2_upper} » absent de la table TVA",
+                expected_value="Code alpha-2 connu (FR, DE, IT…)",
+                actual_value=alpha2_upper,
+            ))
+            logger.warning("Alpha-2 inconnu pour %s : %s", ref, alpha2_upper)
 
         return lookup, anomalies
 
@@ -184,7 +196,12 @@ class ManoManoParser(BaseParser):
         - tva_rate: float
         """
         channel_config = config.channels["manomano"]
-        df = self.read_csv(ca_path, configured_sep=channel_config.separator, encoding=channel_config.encoding)
+        df = self.read_csv(
+            ca_path,
+            configured_sep=channel_config.separator,
+            encoding=channel_config.encoding,
+            usecols=lambda col: col in CA_USECOLS,
+        )
         df = self.apply_column_aliases(df, CA_COLUMN_ALIASES)
         self.validate_columns(df, CA_REQUIRED_COLUMNS)
 
@@ -193,6 +210,8 @@ class ManoManoParser(BaseParser):
             raise ParseError("default_country_code requis pour le canal manomano")
 
         tva_rate_default = float(config.vat_table[default_country_code]["rate"])
+        # Taux de TVA par pays, lus une fois par pays rencontré
+        tva_rates: dict[str, float] = {default_country_code: tva_rate_default}
 
         if country_lookup is None:
             country_lookup = {}
@@ -202,33 +221,66 @@ class ManoManoParser(BaseParser):
 
         df["createdAt"] = pd.to_datetime(df["createdAt"], format="mixed", errors="coerce", utc=True)
 
+        # Contrôles et conversions par colonne (vectorisés), puis un seul
+        # parcours Python sur des listes natives, dans l'ordre des lignes.
+        amounts_nan = df[CA_AMOUNT_COLUMNS].isna()
+        amounts = df[CA_AMOUNT_COLUMNS].astype(float)
+        created = df["createdAt"]
+        columns = zip(
+            df["reference"].tolist(),
+            df["reference"].notna().tolist(),
+            df["type"].tolist(),
+            created.dt.date.tolist(),
+            created.notna().tolist(),
+            amounts_nan.any(axis=1).tolist(),
+            amounts_nan.idxmax(axis=1).tolist(),
+            amounts["amountVatIncl"].tolist(),
+            amounts["commissionVatIncl"].tolist(),
+            amounts["commissionVatExcl"].tolist(),
+            amounts["netAmount"].tolist(),
+            amounts["productPriceVatExcl"].tolist(),
+            amounts["vatOnProduct"].tolist(),
+            amounts["shippingPriceVatExcl"].tolist(),
+            amounts["vatOnShipping"].tolist(),
+        )
+
         rows: list[dict[str, Any]] = []
         anomalies: list[Anomaly] = []
 
-        for idx, row in df.iterrows():
-            ref_raw = row["reference"]
-            ref = str(ref_raw) if pd.notna(ref_raw) else ""
-
-            # Check for NaN in amount columns
-            has_nan = False
-            for col in CA_AMOUNT_COLUMNS:
-                if pd.isna(row[col]):
-                    anomalies.append(Anomaly(
-                        type="parse_warning",
-                        severity="warning",
-                        reference=ref,
-                        channel="manomano",
-                        detail=f"Valeur non-numérique dans la colonne {col}",
-                        expected_value=None,
-                        actual_value=None,
-                    ))
-                    has_nan = True
-                    break
+        for (
+            ref_raw,
+            has_ref,
+            type_raw,
+            date_val,
+            has_date,
+            has_nan,
+            nan_col,
+            amount_vat_incl,
+            commission_vat_incl,
+            commission_vat_excl,
+            net_amount,
+            product_price_vat_excl,
+            vat_on_product,
+            shipping_price_vat_excl,
+            vat_on_shipping,
+        ) in columns:
+            ref = str(ref_raw) if has_ref else ""
+
+            # Check for NaN in amount columns (première colonne fautive)
             if has_nan:
+                anomalies.append(Anomaly(
+                    type="parse_warning",
+                    severity="warning",
+                    reference=ref,
+                    channel="manomano",
+                    detail=f"Valeur non-numérique dans la colonne {nan_col}",
+                    expected_value=None,
+                    actual_value=None,
+                ))
                 logger.warning("Ligne ignorée (valeur non-numérique) : %s", ref)
                 continue
 
-            raw_type = str(row["type"])
+            raw_type = str(type_raw)
             if raw_type == "ORDER":
                 tx_type = "sale"
             elif raw_type == "REFUND":
@@ -246,19 +298,19 @@ class ManoManoParser(BaseParser):
                 logger.warning("Ligne ignorée (type inconnu) : %s - %s", ref, raw_type)
                 continue
 
-            date_val = row["createdAt"]
-            parsed_date: datetime.date | None = None
-            if pd.notna(date_val):
-                parsed_date = date_val.date()
+            parsed_date: datetime.date | None = date_val if has_date else None
 
             # Per-line country resolution via lookup
-            if country_lookup and ref in country_lookup:
-                country_code = country_lookup[ref]
-                tva_rate = float(config.vat_table[country_code]["rate"])
+            lookup_code = country_lookup.get(ref) if country_lookup else None
+            if lookup_code is not None:
+                country_code = lookup_code
+                if country_code not in tva_rates:
+                    tva_rates[country_code] = float(config.vat_table[country_code]["rate"])
+                tva_rate = tva_rates[country_code]
             else:
                 country_code = default_country_code
                 tva_rate = tva_rate_default
-                if country_lookup and ref not in country_lookup:
+                if country_lookup:
                     anomalies.append(Anomaly(
                         type="order_reference_not_in_lookup",
                         severity="info",
@@ -270,28 +322,44 @@ class ManoManoParser(BaseParser):
                     ))
                     logger.info("Référence %s absente du lookup order_details", ref)
 
+            # round() Python et non Series.round() : numpy arrondit x * 100 puis
+            # divise, ce qui diverge de round(x, 2) sur certaines demies.
+            commission_ttc = round(abs(commission_vat_incl), 2)
+            commission_ht = round(abs(commission_vat_excl), 2)
             rows.append({
                 "reference": ref,
                 "type": tx_type,
                 "date": parsed_date,
-                "amount_ht": round(abs(float(row["productPriceVatExcl"])), 2),
-                "amount_tva": round(abs(float(row["vatOnProduct"])), 2),
-                "amount_ttc": round(abs(float(row["amountVatIncl"])), 2),
-                "shipping_ht": round(abs(float(row["shippingPriceVatExcl"])), 2),
-                "shipping_tva": round(abs(float(row["vatOnShipping"])), 2),
-                "commission_ttc": -round(abs(float(row["commissionVatIncl"])), 2) if tx_type == "sale" else round(abs(float(row["commissionVatIncl"])), 2),
-                "commission_ht": -round(abs(float(row["commissionVatExcl"])), 2) if tx_type == "sale" else round(abs(float(row["commissionVatExcl"])), 2),
-                "net_amount": round(float(row["netAmount"]), 2),
+                "amount_ht": round(abs(product_price_vat_excl), 2),
+                "amount_tva": round(abs(vat_on_product), 2),
+                "amount_ttc": round(abs(amount_vat_incl), 2),
+                "shipping_ht": round(abs(shipping_price_vat_excl), 2),
+                "shipping_tva": round(abs(vat_on_shipping), 2),
+                "commission_ttc": -commission_ttc if tx_type == "sale" else commission_ttc,
+                "commission_ht": -commission_ht if tx_type == "sale" else commission_ht,
+                "net_amount": round(net_amount, 2),
                 "country_code": country_code,
                 "tva_rate": tva_rate,
             })
 
         return rows, anomalies
 
+    @staticmethod
+    def _coerce_payout_columns(df: pd.DataFrame) -> None:
+        """Convertit en place AMOUNT, AMOUNT_HT et PAYOUT_DATE du fichier Versements.
+
+        Appelée une fois par parse() ; _parse_payout_lines et
+        _aggregate_payout_summaries reçoivent le DataFrame déjà converti.
+        """
+        for col in ("AMOUNT", "AMOUNT_HT"):
+            if col in df.columns:
+                df[col] = pd.to_numeric(df[col], errors="coerce")
+        df["PAYOUT_DATE"] = pd.to_datetime(df["PAYOUT_DATE"], format=DATE_FORMAT_PAYOUT, errors="coerce")
+
     def _parse_payout_lines(
         self, df: pd.DataFrame, config: AppConfig
     ) -> tuple[list[dict[str, Any]], dict[str, tuple[datetime.date, str]], list[Anomaly]]:
-        """Parse les lignes du fichier Versements.
+        """Parse les lignes du fichier Versements (colonnes déjà converties).
 
         Retourne :
         - special_rows_data : dicts pour les lignes spéciales
@@ -299,28 +367,50 @@ class ManoManoParser(BaseParser):
         - anomalies : anomalies collectées
         """
         self.validate_columns(df, PAYOUT_REQUIRED_COLUMNS)
+        assert is_datetime64_any_dtype(df["PAYOUT_DATE"]), "PAYOUT_DATE non converti (_coerce_payout_columns)"
 
         channel_config = config.channels["manomano"]
         country_code = channel_config.default_country_code
         if country_code is None:
             raise ParseError("default_country_code requis pour le canal manomano")
 
-        df["AMOUNT"] = pd.to_numeric(df["AMOUNT"], errors="coerce")
         has_amount_ht = "AMOUNT_HT" in df.columns
+
+        # Colonnes converties en listes natives une fois, puis un seul parcours
+        # dans l'ordre des lignes (les anomalies gardent l'ordre du fichier).
+        payout_dates = df["PAYOUT_DATE"]
+        amounts = df["AMOUNT"]
         if has_amount_ht:
-            df["AMOUNT_HT"] = pd.to_numeric(df["AMOUNT_HT"], errors="coerce")
-        df["PAYOUT_DATE"] = pd.to_datetime(df["PAYOUT_DATE"], format=DATE_FORMAT_PAYOUT, errors="coerce")
+            amounts_ht: list[float | None] = [
+                value if present else None
+                for value, present in zip(df["AMOUNT_HT"].tolist(), df["AMOUNT_HT"].notna().tolist())
+            ]
+        else:
+            amounts_ht = [None] * len(df)
+        columns = zip(
+            df["REFERENCE"].tolist(),
+            df["REFERENCE"].notna().tolist(),
+            df["TYPE"].tolist(),
+            df["PAYOUT_REFERENCE"].tolist(),
+            df["PAYOUT_REFERENCE"].notna().tolist(),
+            payout_dates.dt.date.tolist(),
+            payout_dates.notna().tolist(),
+            amounts.tolist(),
+            amounts.notna().tolist(),
+            amounts_ht,
+        )
 
         special_rows: list[dict[str, Any]] = []
         lookup_dict: dict[str, tuple[datetime.date, str]] = {}
         anomalies: list[Anomaly] = []
 
-        for idx, row in df.iterrows():
-            ref_raw = row["REFERENCE"]
-            ref = str(ref_raw) if pd.notna(ref_raw) else ""
-            raw_type = str(row["TYPE"])
-            payout_ref_raw = row["PAYOUT_REFERENCE"]
-            payout_ref = str(payout_ref_raw) if pd.notna(payout_ref_raw) else ""
+        for (
+            ref_raw, has_ref, type_raw, payout_ref_raw, has_payout_ref,
+            payout_date, has_payout_date, amount, has_amount, amount_ht_raw,
+        ) in columns:
+            ref = str(ref_raw) if has_ref else ""
+            raw_type = str(type_raw)
+            payout_ref = str(payout_ref_raw) if has_payout_ref else ""
 
             if raw_type not in KNOWN_PAYOUT_TYPES:
                 anomalies.append(Anomaly(
@@ -329,14 +419,13 @@ class ManoManoParser(BaseParser):
                     reference=ref,
                     channel="manomano",
                     detail=f"Type de versement « {raw_type} » non reconnu dans le fichier Versements — cette ligne a été ignorée",
-                    expected_value=", ".join(sorted(KNOWN_PAYOUT_TYPES)),
+                    expected_value=KNOWN_PAYOUT_TYPES_DISPLAY,
                     actual_value=raw_type,
                 ))
                 logger.warning("Ligne Versement ignorée (type inconnu) : %s - %s", ref, raw_type)
                 continue
 
-            payout_date_val = row["PAYOUT_DATE"]
-            if pd.isna(payout_date_val):
+            if not has_payout_date:
                 anomalies.append(Anomaly(
                     type="invalid_date",
                     severity="warning",
@@ -349,9 +438,7 @@ class ManoManoParser(BaseParser):
                 logger.warning("Ligne Versement ignorée (date invalide) : %s", ref)
                 continue
 
-            payout_date: datetime.date = payout_date_val.date()
-
-            if pd.isna(row["AMOUNT"]):
+            if not has_amount:
                 anomalies.append(Anomaly(
                     type="parse_warning",
                     severity="warning",
@@ -365,11 +452,11 @@ class ManoManoParser(BaseParser):
                 continue
 
             if raw_type in SPECIAL_TYPES:
-                amount_val = round(float(row["AMOUNT"]), 2)
+                amount_val = round(float(amount), 2)
                 amount_ht = 0.0
                 amount_tva = 0.0
-                if has_amount_ht and pd.notna(row.get("AMOUNT_HT")):
-                    ht_val = round(float(row["AMOUNT_HT"]), 2)
+                if amount_ht_raw is not None:
+                    ht_val = round(float(amount_ht_raw), 2)
                     amount_ht = round(abs(ht_val), 2)
                     amount_tva = round(abs(ht_val - amount_val), 2)
                 special_rows.append({
@@ -393,16 +480,30 @@ class ManoManoParser(BaseParser):
     def _aggregate_payout_summaries(
         self, df: pd.DataFrame
     ) -> tuple[list[PayoutSummary], list[Anomaly]]:
-        """Agrège les lignes Versements par PAYOUT_REFERENCE en PayoutSummary."""
-        df["AMOUNT"] = pd.to_numeric(df["AMOUNT"], errors="coerce")
-        df["PAYOUT_DATE"] = pd.to_datetime(df["PAYOUT_DATE"], format=DATE_FORMAT_PAYOUT, errors="coerce")
+        """Agrège les lignes Versements par PAYOUT_REFERENCE en PayoutSummary (colonnes déjà converties)."""
+        assert is_datetime64_any_dtype(df["PAYOUT_DATE"]), "PAYOUT_DATE non converti (_coerce_payout_columns)"
+
+        # Agrégats calculés en une passe groupby par colonne (même ordre de
+        # groupes que l'itération : clés triées, PAYOUT_REFERENCE vide exclue).
+        # Date de la première ligne du groupe, même invalide : drop_duplicates
+        # garde la première occurrence de chaque clé (GroupBy.first n'accepte
+        # skipna qu'à partir de pandas 2.2.1).
+        totals = df.groupby("PAYOUT_REFERENCE")["AMOUNT"].sum()
+        first_dates = (
+            df.drop_duplicates("PAYOUT_REFERENCE")
+            .set_index("PAYOUT_REFERENCE")["PAYOUT_DATE"]
+            .reindex(totals.index)
+        )
+        order_refund = df[df["TYPE"].isin(ORDER_REFUND_TYPES)]
+        references_by_payout: dict[object, list[str]] = (
+            order_refund["REFERENCE"].astype(str).groupby(order_refund["PAYOUT_REFERENCE"]).agg(list).to_dict()
+        )
 
         summaries: list[PayoutSummary] = []
         anomalies: list[Anomaly] = []
 
-        for payout_ref, group in df.groupby("PAYOUT_REFERENCE"):
+        for payout_ref, first_date, total in zip(first_dates.index.tolist(), first_dates.tolist(), totals.tolist()):
             payout_ref_str = str(payout_ref)
-            first_date = group["PAYOUT_DATE"].iloc[0]
 
             if pd.isna(first_date):
                 anomalies.append(Anomaly(
@@ -417,21 +518,14 @@ class ManoManoParser(BaseParser):
                 logger.warning("Payout ignoré (date invalide) : %s", payout_ref_str)
                 continue
 
-            payout_date: datetime.date = first_date.date()
-
-            total_amount = round(float(group["AMOUNT"].sum()), 2)
-
-            order_refund_mask = group["TYPE"].isin({"ORDER", "REFUND"})
-            transaction_references = group.loc[order_refund_mask, "REFERENCE"].astype(str).tolist()
-
             summaries.append(PayoutSummary(
-                payout_date=payout_date,
+                payout_date=first_date.date(),
                 channel="manomano",
-                total_amount=total_amount,
+                total_amount=round(float(total), 2),
                 charges=0.0,
                 refunds=0.0,
                 fees=0.0,
-                transaction_references=transaction_references,
+                transaction_references=references_by_payout.get(payout_ref, []),
                 psp_type=None,
                 payout_reference=payout_ref_str,
             ))
@@ -457,10 +551,17 @@ class ManoManoParser(BaseParser):
         ca_rows, ca_anomalies = self._parse_ca(ca_path, config, country_lookup)
 
         # Parse Versements
-        payout_df = self.read_csv(payouts_path, configured_sep=channel_config.separator, encoding=channel_config.encoding)
+        # En-têtes comparés après strip : strip_whitespace ne s'applique qu'après lecture
+        payout_df = self.read_csv(
+            payouts_path,
+            configured_sep=channel_config.separator,
+            encoding=channel_config.encoding,
+            usecols=lambda col: col.strip() in PAYOUT_USECOLS,
+        )
         payout_df = self.strip_whitespace(payout_df)
         payout_df = self.apply_column_aliases(payout_df, PAYOUT_COLUMN_ALIASES)
         self.validate_columns(payout_df, PAYOUT_REQUIRED_COLUMNS)
+        self._coerce_payout_columns(payout_df)
 
         special_rows, lookup_dict, payout_anomalies = self._parse_payout_lines(payout_df, config)
         payout_summaries, summary_anomalies = self._aggregate_payout_summaries(payout_df)
@@ -469,16 +570,14 @@ class ManoManoParser(BaseParser):
 
         # Build NormalizedTransaction from CA rows with payout enrichment
         ca_transactions: list[NormalizedTransaction] = []
-        matched_refs: set[str] = set()
 
         for row in ca_rows:
-            ref = str(row["reference"])
+            ref = row["reference"]
             payout_date: datetime.date | None = None
             payout_reference: str | None = None
 
             if ref in lookup_dict:
                 payout_date, payout_reference = lookup_dict[ref]
-                matched_refs.add(ref)
 
             # Fallback date
             tx_date = row["date"]
@@ -502,50 +601,53 @@ class ManoManoParser(BaseParser):
                 reference=ref,
                 channel="manomano",
                 date=tx_date,
-                type=str(row["type"]),
-                amount_ht=float(row["amount_ht"]),
-                amount_tva=float(row["amount_tva"]),
-                amount_ttc=float(row["amount_ttc"]),
-                shipping_ht=float(row["shipping_ht"]),
-                shipping_tva=float(row["shipping_tva"]),
-                tva_rate=float(row["tva_rate"]),
-                country_code=str(row["country_code"]),
-                commission_ttc=float(row["commission_ttc"]),
-                commission_ht=float(row["commission_ht"]),
-                net_amount=float(row["net_amount"]),
+                type=row["type"],
+                amount_ht=row["amount_ht"],
+                amount_tva=row["amount_tva"],
+                amount_ttc=row["amount_ttc"],
+                shipping_ht=row["shipping_ht"],
+                shipping_tva=row["shipping_tva"],
+                tva_rate=row["tva_rate"],
+                country_code=row["country_code"],
+                commission_ttc=row["commission_ttc"],
+                commission_ht=row["commission_ht"],
+                net_amount=row["net_amount"],
                 payout_date=payout_date,
                 payout_reference=payout_reference,
                 payment_method=None,
                 special_type=None,
             ))
 
-        # Log unmatched payout ORDER/REFUND references
-        for ref in lookup_dict:
-            if ref not in matched_refs:
-                logger.debug("Référence Versement ORDER/REFUND sans correspondance CA : %s", ref)
+        # Log unmatched payout ORDER/REFUND references (ordre du fichier Versements),
+        # calculé seulement si le niveau DEBUG est actif
+        if logger.isEnabledFor(logging.DEBUG):
+            ca_refs = {row["reference"] for row in ca_rows}
+            for ref in lookup_dict:
+                if ref not in ca_refs:
+                    logger.debug("Référence Versement ORDER/REFUND sans correspondance CA : %s", ref)
 
         # Build NormalizedTransaction from special payout lines
         special_transactions: list[NormalizedTransaction] = []
         for row in special_rows:
             special_transactions.append(NormalizedTransaction(
-                reference=str(row["reference"]),
+                reference=row["reference"],
                 channel="manomano",
                 date=row["date"],
                 type="sale",
-                amount_ht=float(row["amount_ht"]),
-                amount_tva=float(row["amount_tva"]),
+                amount_ht=row["amount_ht"],
+                amount_tva=row["amount_tva"],
                 amount_ttc=0.00,
                 shipping_ht=0.00,
                 shipping_tva=0.00,
                 tva_rate=0.0,
-                country_code=str(row["country_code"]),
+                country_code=row["country_code"],
                 commission_ttc=0.00,
                 commission_ht=None,
-                net_amount=float(row["net_amount"]),
+                net_amount=row["net_amount"],
                 payout_date=row["payout_date"],
-                payout_reference=str(row["payout_reference"]),
+                payout_reference=row["payout_reference"],
                 payment_method=None,
-                special_type=str(row["special_type"]),
+                special_type=row["special_type"],
             ))
 
         # Dicts intermédiaires : les NormalizedTransaction frozen sont construites dans parse() après enrichissement payout (matching multi-fichiers)
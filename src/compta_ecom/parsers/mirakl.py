@@ -25,15 +25,38 @@ REQUIRED_COLUMNS = [
 ]
 
 KNOWN_LINE_TYPES = {"Montant", "Frais de port", "Commission", "Taxe sur la commission", "Paiement", "Abonnement", "Taxe sur commande", "Taxe sur frais de port", "Taxe sur abonnement"}
+# Liste affichée dans les anomalies unknown_line_type
+KNOWN_LINE_TYPES_DISPLAY = ", ".join(sorted(KNOWN_LINE_TYPES))
 ORDER_LINE_TYPES = {"Montant", "Frais de port", "Commission", "Taxe sur la commission", "Taxe sur commande", "Taxe sur frais de port"}
 
+# Types sommés par commande dans _aggregate_orders (ordre de déballage)
+_ORDER_SUM_TYPES = [
+    "Montant",
+    "Frais de port",
+    "Commission",
+    "Taxe sur la commission",
+    "Taxe sur commande",
+    "Taxe sur frais de port",
+]
+
 DATE_FORMAT = "%Y-%m-%d"
 
+# Formats de date des exports, essayés dans l'ordre avant le parsing "mixed"
+# (lent, valeur par valeur) réservé aux valeurs restantes
+DATE_INPUT_FORMATS = ("ISO8601", "%d/%m/%Y - %H:%M:%S")
+
 # Aliases : colonne attendue → alternatives dans les exports réels
 COLUMN_ALIASES: dict[str, list[str]] = {
     "Date de commande": ["Date de création", "Date de transaction"],
 }
 
+# Colonnes lues dans l'export (requises, alias et colonnes optionnelles) :
+# les autres colonnes des exports réels ne sont pas parsées (usecols)
+USED_COLUMNS = frozenset(REQUIRED_COLUMNS).union(
+    *COLUMN_ALIASES.values(),
+    ("Canal de diffusion", "ID du remboursement", "Solde"),
+)
+
 # Normalisation des Type : valeur réelle → valeur attendue par le parser
 TYPE_ALIASES: dict[str, str] = {
     "Montant de commande": "Montant",
@@ -121,16 +144,24 @@ class MiraklParser(BaseParser):
     ) -> tuple[pd.DataFrame, list[Anomaly]]:
         """Lit le CSV, valide les colonnes, convertit les numériques, parse les dates."""
         channel_config = config.channels[self.channel]
-        df = self.read_csv(data_path, configured_sep=channel_config.separator, encoding=channel_config.encoding)
+        # En-têtes comparés après strip, comme le nettoyage ci-dessous
+        df = self.read_csv(
+            data_path,
+            configured_sep=channel_config.separator,
+            encoding=channel_config.encoding,
+            usecols=lambda col: col.strip() in USED_COLUMNS,
+        )
 
         # Nettoyer les noms de colonnes (supprimer les espaces en début/fin)
         df.columns = df.columns.str.strip()
 
         df = self.apply_column_aliases(df, COLUMN_ALIASES)
 
-        # Normaliser les valeurs Type via les alias (seulement si la colonne existe)
+        # Normaliser les valeurs Type via les alias, une fois par valeur distincte
+        # (seulement si la colonne existe)
         if "Type" in df.columns:
-            df["Type"] = df["Type"].map(lambda t: TYPE_ALIASES.get(str(t).strip(), str(t).strip()))
+            normalized_types = {t: TYPE_ALIASES.get(str(t).strip(), str(t).strip()) for t in df["Type"].unique()}
+            df["Type"] = df["Type"].map(normalized_types)
 
         self.validate_columns(df, REQUIRED_COLUMNS)
 
@@ -140,16 +171,18 @@ class MiraklParser(BaseParser):
         original_montant = df["Montant"].copy()
         df["Montant"] = pd.to_numeric(df["Montant"], errors="coerce")
         nan_mask = df["Montant"].isna() & original_montant.notna()
-        for idx in df.index[nan_mask]:
-            ref = str(df.at[idx, "Numéro de commande"])
+        for ref_raw, raw_value in zip(
+            df.loc[nan_mask, "Numéro de commande"].tolist(), original_montant[nan_mask].tolist()
+        ):
+            ref = str(ref_raw)
             anomalies.append(Anomaly(
                 type="parse_warning",
                 severity="warning",
                 reference=ref,
                 channel=self.channel,
-                detail=f"Valeur non-numérique dans la colonne Montant : {original_montant.at[idx]!r}",
+                detail=f"Valeur non-numérique dans la colonne Montant : {raw_value!r}",
                 expected_value=None,
-                actual_value=str(original_montant.at[idx]),
+                actual_value=str(raw_value),
             ))
             logger.warning("Ligne ignorée (Montant non-numérique) : %s", ref)
 
@@ -157,13 +190,31 @@ class MiraklParser(BaseParser):
         df = df[df["Montant"].notna()].copy()
 
         # Parse dates — accepter à la fois %Y-%m-%d et %d/%m/%Y - %H:%M:%S
-        df["Date de commande"] = pd.to_datetime(df["Date de commande"], format="mixed", dayfirst=True, errors="coerce")
-        df["Date du cycle de paiement"] = pd.to_datetime(
-            df["Date du cycle de paiement"], format="mixed", dayfirst=True, errors="coerce"
-        )
+        df["Date de commande"] = self._parse_dates(df["Date de commande"])
+        df["Date du cycle de paiement"] = self._parse_dates(df["Date du cycle de paiement"])
 
         return df, anomalies
 
+    @staticmethod
+    def _parse_dates(values: pd.Series) -> pd.Series:
+        """Convertit une colonne de dates, format par format (DATE_INPUT_FORMATS).
+
+        Chaque format n'est appliqué qu'aux valeurs non reconnues par les
+        précédents ; le reliquat passe par ``format="mixed"`` (jour en premier).
+        ISO8601 est essayé en premier : en "mixed", dayfirst lirait
+        2026-01-02 comme le 1er février.
+        """
+        parsed = pd.to_datetime(values, format=DATE_INPUT_FORMATS[0], errors="coerce")
+        for date_format in DATE_INPUT_FORMATS[1:]:
+            residual = parsed.isna() & values.notna()
+            if not residual.any():
+                return parsed
+            parsed[residual] = pd.to_datetime(values[residual], format=date_format, errors="coerce")
+        residual = parsed.isna() & values.notna()
+        if residual.any():
+            parsed[residual] = pd.to_datetime(values[residual], format="mixed", dayfirst=True, errors="coerce")
+        return parsed
+
     def _aggregate_orders(
         self,
         df: pd.DataFrame,
@@ -205,13 +256,66 @@ class MiraklParser(BaseParser):
             # Grouper par (Numéro de commande, ID du remboursement)
             # fillna("") pour que les ventes (sans ID remboursement) soient groupées ensemble
             group_columns = ["Numéro de commande", "ID du remboursement"]
-            df_copy = df.copy()
-            df_copy["ID du remboursement"] = df_copy["ID du remboursement"].fillna("").astype(str)
-            grouped = df_copy.groupby(group_columns)
+            df = df.copy()
+            df["ID du remboursement"] = df["ID du remboursement"].fillna("").astype(str)
         else:
-            grouped = df.groupby("Numéro de commande")
+            group_columns = ["Numéro de commande"]
+
+        # Agrégats par commande calculés en colonnes (groupes dans l'ordre trié
+        # des clés, comme l'itération sur groupby) : sommes par Type, date de
+        # commande de la première ligne, premier canal et première date de
+        # cycle renseignés.
+        grouped = df.groupby(group_columns)
+        payout_dates = grouped["Date du cycle de paiement"].first()
+        group_index = payout_dates.index
+        # Première ligne de chaque groupe, même sans date : drop_duplicates
+        # (GroupBy.first n'accepte skipna qu'à partir de pandas 2.2.1)
+        first_dates = (
+            df.drop_duplicates(group_columns)
+            .set_index(group_columns)["Date de commande"]
+            .reindex(group_index)
+        )
+        sums_by_type = (
+            df.groupby([*group_columns, "Type"])["Montant"]
+            .sum()
+            .unstack("Type", fill_value=0.0)
+            .reindex(index=group_index, columns=_ORDER_SUM_TYPES, fill_value=0.0)
+            .astype(float)
+        )
+        if has_canal_diffusion:
+            canal_values: list[Any] = grouped["Canal de diffusion"].first().tolist()
+        else:
+            canal_values = [None] * len(group_index)
+
+        columns = zip(
+            group_index.tolist(),
+            first_dates.dt.date.tolist(),
+            first_dates.notna().tolist(),
+            sums_by_type["Montant"].tolist(),
+            sums_by_type["Frais de port"].tolist(),
+            sums_by_type["Commission"].tolist(),
+            sums_by_type["Taxe sur la commission"].tolist(),
+            sums_by_type["Taxe sur commande"].tolist(),
+            sums_by_type["Taxe sur frais de port"].tolist(),
+            canal_values,
+            payout_dates.dt.date.tolist(),
+            payout_dates.notna().tolist(),
+        )
 
-        for group_key, group in grouped:
+        for (
+            group_key,
+            first_date,
+            has_date,
+            montant_sum,
+            frais_port_sum,
+            commission_sum,
+            taxe_commission_sum,
+            taxe_produit_sum,
+            taxe_port_sum,
+            canal_value,
+            payout_day,
+            has_payout_date,
+        ) in columns:
             # Extraire la référence depuis la clé de regroupement
             if has_refund_id and isinstance(group_key, tuple):
                 order_ref, refund_id = group_key
@@ -222,13 +326,6 @@ class MiraklParser(BaseParser):
             else:
                 ref_str = str(group_key).strip()
 
-            montant_sum = float(group.loc[group["Type"] == "Montant", "Montant"].sum())
-            frais_port_sum = float(group.loc[group["Type"] == "Frais de port", "Montant"].sum())
-            commission_sum = float(group.loc[group["Type"] == "Commission", "Montant"].sum())
-            taxe_commission_sum = float(
-                group.loc[group["Type"] == "Taxe sur la commission", "Montant"].sum()
-            )
-
             # Determine sale/refund
             if montant_sum > 0:
                 tx_type = "sale"
@@ -252,8 +349,7 @@ class MiraklParser(BaseParser):
                 continue
 
             # Date
-            first_date = group["Date de commande"].iloc[0]
-            if pd.isna(first_date):
+            if not has_date:
                 anomalies.append(Anomaly(
                     type="missing_date",
                     severity="warning",
@@ -266,20 +362,18 @@ class MiraklParser(BaseParser):
                 logger.warning("Commande ignorée (date manquante) : %s", ref_str)
                 continue
 
-            order_date: datetime.date = first_date.date()
+            order_date: datetime.date = first_date
 
             # Déterminer le pays et taux TVA depuis Canal de diffusion
             tva_rate = default_tva_rate
             country_code = default_country_code
-            if has_canal_diffusion:
-                canal_values = group["Canal de diffusion"].dropna()
-                if not canal_values.empty:
-                    country_name = str(canal_values.iloc[0]).strip()
-                    alpha2 = COUNTRY_NAME_TO_ALPHA2.get(country_name)
-                    if alpha2 and alpha2 in alpha2_to_numeric:
-                        country_code = alpha2_to_numeric[alpha2]
-                        if country_code in vat_table:
-                            tva_rate = float(vat_table[country_code]["rate"])
+            if has_canal_diffusion and pd.notna(canal_value):
+                country_name = str(canal_value).strip()
+                alpha2 = COUNTRY_NAME_TO_ALPHA2.get(country_name)
+                if alpha2 and alpha2 in alpha2_to_numeric:
+                    country_code = alpha2_to_numeric[alpha2]
+                    if country_code in vat_table:
+                        tva_rate = float(vat_table[country_code]["rate"])
 
             # Calcul des montants HT/TTC selon le mode
             if amounts_are_ttc:
@@ -305,9 +399,6 @@ class MiraklParser(BaseParser):
                 shipping_ht = round(abs(frais_port_sum), 2)
 
                 # Utiliser les montants de taxe explicite du CSV si disponibles
-                taxe_produit_sum = float(group.loc[group["Type"] == "Taxe sur commande", "Montant"].sum())
-                taxe_port_sum = float(group.loc[group["Type"] == "Taxe sur frais de port", "Montant"].sum())
-
                 if taxe_produit_sum != 0.0 or taxe_port_sum != 0.0:
                     # TVA explicite (Leroy Merlin) : montants exacts du CSV
                     amount_tva = round(abs(taxe_produit_sum), 2)
@@ -328,11 +419,9 @@ class MiraklParser(BaseParser):
             # Extraire la Date du cycle de paiement depuis les lignes commande
             order_payout_date: datetime.date | None = None
             order_payout_reference: str | None = None
-            if "Date du cycle de paiement" in group.columns:
-                payout_dates = group["Date du cycle de paiement"].dropna()
-                if not payout_dates.empty:
-                    order_payout_date = payout_dates.iloc[0].date()
-                    order_payout_reference = order_payout_date.strftime("%Y-%m-%d")
+            if has_payout_date:
+                order_payout_date = payout_day
+                order_payout_reference = payout_day.strftime("%Y-%m-%d")
 
             orders.append({
                 "reference": ref_str,
@@ -361,31 +450,39 @@ class MiraklParser(BaseParser):
 
         Le DataFrame reçu est pré-filtré (Type="Paiement" uniquement).
         """
-        lookup: dict[str, tuple[datetime.date, str]] = {}
         anomalies: list[Anomaly] = []
 
-        for idx, row in df.iterrows():
-            date_cycle = row["Date du cycle de paiement"]
-            ref = row["Numéro de commande"]
+        dates_cycle = df["Date du cycle de paiement"]
+        refs = df["Numéro de commande"]
+        has_date_cycle = dates_cycle.notna()
 
-            if pd.isna(date_cycle):
-                anomalies.append(Anomaly(
-                    type="invalid_date",
-                    severity="warning",
-                    reference=str(ref) if pd.notna(ref) else "",
-                    channel=self.channel,
-                    detail="Date du cycle de paiement invalide ou manquante — ligne de paiement ignorée",
-                    expected_value=DATE_FORMAT,
-                    actual_value=None,
-                ))
-                logger.warning("Ligne Paiement ignorée (date cycle invalide) : index %s", idx)
-                continue
-
-            payout_date: datetime.date = date_cycle.date()
-            payout_reference = payout_date.strftime("%Y-%m-%d")
-
-            if pd.notna(ref) and str(ref).strip():
-                lookup[str(ref)] = (payout_date, payout_reference)
+        # Lignes sans date de cycle : une anomalie chacune, dans l'ordre du fichier
+        invalid = ~has_date_cycle
+        invalid_refs = refs[invalid]
+        for idx, ref, has_ref in zip(
+            df.index[invalid].tolist(), invalid_refs.tolist(), invalid_refs.notna().tolist()
+        ):
+            anomalies.append(Anomaly(
+                type="invalid_date",
+                severity="warning",
+                reference=str(ref) if has_ref else "",
+                channel=self.channel,
+                detail="Date du cycle de paiement invalide ou manquante — ligne de paiement ignorée",
+                expected_value=DATE_FORMAT,
+                actual_value=None,
+            ))
+            logger.warning("Ligne Paiement ignorée (date cycle invalide) : index %s", idx)
+
+        # Lignes datées avec référence non vide : lookup construit d'un bloc
+        # (à référence dupliquée, la dernière ligne l'emporte)
+        with_ref = has_date_cycle & refs.notna()
+        keys = refs[with_ref].astype(str)
+        non_blank = (keys.str.strip() != "").to_numpy()
+        payout_dates = dates_cycle[with_ref][non_blank]
+        lookup: dict[str, tuple[datetime.date, str]] = dict(zip(
+            keys[non_blank].tolist(),
+            zip(payout_dates.dt.date.tolist(), payout_dates.dt.strftime(DATE_FORMAT).tolist()),
+        ))
 
         return lookup, anomalies
 
@@ -393,28 +490,29 @@ class MiraklParser(BaseParser):
         """Agrège les lignes Paiement par Date du cycle de paiement."""
         summaries: list[PayoutSummary] = []
 
-        for date_cycle, group in df.groupby("Date du cycle de paiement"):
-            if pd.isna(date_cycle):
-                continue
+        # Totaux par cycle en une passe groupby (cycles triés, dates invalides
+        # exclues par le groupby) ; références non vides dans l'ordre des lignes.
+        grouped = df.groupby("Date du cycle de paiement")
+        totals = grouped["Montant"].sum()
+        refs = df["Numéro de commande"]
+        valid_refs = refs.notna() & (refs.astype(str).str.strip() != "")
+        with_ref = df[valid_refs]
+        refs_by_cycle: dict[Any, list[str]] = (
+            with_ref["Numéro de commande"].map(str).groupby(with_ref["Date du cycle de paiement"]).agg(list).to_dict()
+        )
 
-            payout_date: datetime.date = pd.Timestamp(str(date_cycle)).date()
+        for date_cycle, total in zip(totals.index, totals.tolist()):
+            payout_date: datetime.date = date_cycle.date()
             payout_reference = payout_date.strftime("%Y-%m-%d")
-            total_amount = round(float(group["Montant"].sum()), 2)
-
-            refs: list[str] = []
-            for _, row in group.iterrows():
-                ref = row["Numéro de commande"]
-                if pd.notna(ref) and str(ref).strip():
-                    refs.append(str(ref))
 
             summaries.append(PayoutSummary(
                 payout_date=payout_date,
                 channel=self.channel,
-                total_amount=total_amount,
+                total_amount=round(float(total), 2),
                 charges=0.0,
                 refunds=0.0,
                 fees=0.0,
-                transaction_references=refs,
+                transaction_references=refs_by_cycle.get(date_cycle, []),
                 psp_type=None,
                 payout_reference=payout_reference,
             ))
@@ -428,22 +526,33 @@ class MiraklParser(BaseParser):
         subs: list[dict[str, Any]] = []
         anomalies: list[Anomaly] = []
 
-        for idx, row in df.iterrows():
+        dates_cycle = df["Date du cycle de paiement"]
+        dates_creation = df["Date de commande"]
+        refs = df["Numéro de commande"]
+        columns = zip(
+            dates_cycle.dt.date.tolist(),
+            dates_cycle.notna().tolist(),
+            dates_creation.dt.date.tolist(),
+            dates_creation.notna().tolist(),
+            refs.tolist(),
+            refs.notna().tolist(),
+            df["Montant"].tolist(),
+        )
+
+        for cycle_date, has_date_cycle, creation_day, has_creation, ref_raw, has_ref, montant in columns:
             # Date du cycle de paiement : optionnelle (absente pour les abonnements "Payable")
-            date_cycle = row["Date du cycle de paiement"]
             payout_date: datetime.date | None = None
             payout_reference: str | None = None
-            if not pd.isna(date_cycle):
-                payout_date = date_cycle.date()
-                payout_reference = payout_date.strftime("%Y-%m-%d")
+            if has_date_cycle:
+                payout_date = cycle_date
+                payout_reference = cycle_date.strftime("%Y-%m-%d")
 
             # Date d'écriture = Date de commande (alias "Date de création"), colonne 1
-            date_creation = row["Date de commande"]
-            if pd.isna(date_creation):
+            if not has_creation:
                 anomalies.append(Anomaly(
                     type="invalid_date",
                     severity="warning",
-                    reference=str(row["Numéro de commande"]) if pd.notna(row["Numéro de commande"]) else "",
+                    reference=str(ref_raw) if has_ref else "",
                     channel=self.channel,
                     detail="Date de commande invalide pour l'abonnement — ligne d'abonnement ignorée",
                     expected_value=DATE_FORMAT,
@@ -451,10 +560,9 @@ class MiraklParser(BaseParser):
                 ))
                 continue
 
-            creation_date: datetime.date = date_creation.date()
+            creation_date: datetime.date = creation_day
 
-            ref_raw = row["Numéro de commande"]
-            if pd.notna(ref_raw) and str(ref_raw).strip():
+            if has_ref and str(ref_raw).strip():
                 reference = str(ref_raw)
             else:
                 reference = f"ABO-{self.channel}-{creation_date:%Y%m%d}"
@@ -464,7 +572,7 @@ class MiraklParser(BaseParser):
                 "special_type": "SUBSCRIPTION",
                 "type": "sale",
                 "date": creation_date,
-                "net_amount": round(float(row["Montant"]), 2),
+                "net_amount": round(float(montant), 2),
                 "payout_date": payout_date,
                 "payout_reference": payout_reference,
                 "country_code": country_code,
@@ -492,16 +600,17 @@ class MiraklParser(BaseParser):
 
         # 4. Filter unknown line types
         unknown_mask = ~df["Type"].isin(KNOWN_LINE_TYPES)
-        for idx in df.index[unknown_mask]:
-            ref = str(df.at[idx, "Numéro de commande"])
-            line_type = str(df.at[idx, "Type"])
+        unknown_lines = df.loc[unknown_mask, ["Numéro de commande", "Type"]]
+        for ref_raw, type_raw in zip(unknown_lines["Numéro de commande"].tolist(), unknown_lines["Type"].tolist()):
+            ref = str(ref_raw)
+            line_type = str(type_raw)
             anomalies.append(Anomaly(
                 type="unknown_line_type",
                 severity="warning",
                 reference=ref,
                 channel=self.channel,
                 detail=f"Type de ligne « {line_type} » non reconnu dans le fichier — cette ligne a été ignorée",
-                expected_value=", ".join(sorted(KNOWN_LINE_TYPES)),
+                expected_value=KNOWN_LINE_TYPES_DISPLAY,
                 actual_value=line_type,
             ))
             logger.warning("Ligne ignorée (type inconnu) : %s - %s", ref, line_type)
@@ -533,30 +642,34 @@ class MiraklParser(BaseParser):
         anomalies.extend(sub_anomalies)
 
         # 7. Enrich order dicts with payout info and build NormalizedTransaction
+        # (les dicts portent déjà des str/float natifs : pas de reconversion)
+        channel = self.channel
         order_transactions: list[NormalizedTransaction] = []
         for od in order_dicts:
-            ref = str(od["reference"])
+            ref = od["reference"]
             # Prefer payout info extracted from order lines, fallback to payment_lookup
-            payout_date: datetime.date | None = od.get("payout_date")
-            payout_reference: str | None = od.get("payout_reference")
-            if payout_date is None and ref in payment_lookup:
-                payout_date, payout_reference = payment_lookup[ref]
+            payout_date: datetime.date | None = od["payout_date"]
+            payout_reference: str | None = od["payout_reference"]
+            if payout_date is None:
+                payout_info = payment_lookup.get(ref)
+                if payout_info is not None:
+                    payout_date, payout_reference = payout_info
 
             order_transactions.append(NormalizedTransaction(
                 reference=ref,
-                channel=self.channel,
+                channel=channel,
                 date=od["date"],
-                type=str(od["type"]),
-                amount_ht=float(od["amount_ht"]),
-                amount_tva=float(od["amount_tva"]),
-                amount_ttc=float(od["amount_ttc"]),
-                shipping_ht=float(od["shipping_ht"]),
-                shipping_tva=float(od["shipping_tva"]),
-                tva_rate=float(od["tva_rate"]),
-                country_code=str(od["country_code"]),
-                commission_ttc=float(od["commission_ttc"]),
-                commission_ht=float(od["commission_ht"]),
-                net_amount=float(od["net_amount"]),
+                type=od["type"],
+                amount_ht=od["amount_ht"],
+                amount_tva=od["amount_tva"],
+                amount_ttc=od["amount_ttc"],
+                shipping_ht=od["shipping_ht"],
+                shipping_tva=od["shipping_tva"],
+                tva_rate=od["tva_rate"],
+                country_code=od["country_code"],
+                commission_ttc=od["commission_ttc"],
+                commission_ht=od["commission_ht"],
+                net_amount=od["net_amount"],
                 payout_date=payout_date,
                 payout_reference=payout_reference,
                 payment_method=None,
@@ -567,8 +680,8 @@ class MiraklParser(BaseParser):
         sub_transactions: list[NormalizedTransaction] = []
         for sd in sub_dicts:
             sub_transactions.append(NormalizedTransaction(
-                reference=str(sd["reference"]),
-                channel=self.channel,
+                reference=sd["reference"],
+                channel=channel,
                 date=sd["date"],
                 type="sale",
                 amount_ht=0.00,
@@ -577,10 +690,10 @@ class MiraklParser(BaseParser):
                 shipping_ht=0.00,
                 shipping_tva=0.00,
                 tva_rate=0.0,
-                country_code=str(sd["country_code"]),
+                country_code=sd["country_code"],
                 commission_ttc=0.00,
                 commission_ht=None,
-                net_amount=float(sd["net_amount"]),
+                net_amount=sd["net_amount"],
                 payout_date=sd["payout_date"],
                 payout_reference=sd["payout_reference"],
                 payment_method=None,
@@ -1,7 +1,8 @@
-"""Tests pour engine/accounts.py — build_account(), verify_balance() et normalize_lettrage()."""
+"""Tests pour engine/accounts.py — build_account(), build_transit_pair(), split_signed(), to_cents(), verify_balance() et normalize_lettrage()."""
 
 from __future__ import annotations
 
+import dataclasses
 import datetime
 
 import pytest
@@ -9,8 +10,11 @@ import pytest
 from compta_ecom.engine.accounts import (
     _index_to_letter,
     build_account,
+    build_transit_pair,
     normalize_lettrage,
     resolve_shipping_zone,
+    split_signed,
+    to_cents,
     verify_balance,
 )
 from compta_ecom.models import AccountingEntry, BalanceError
@@ -143,6 +147,103 @@ class TestVerifyBalance:
         with pytest.raises(BalanceError):
             verify_balance(entries)
 
+    def test_many_cent_lines_balanced(self) -> None:
+        """Somme exacte en centimes : 10 × 0.10 au débit = 1.00 au crédit."""
+        line = AccountingEntry(
+            date=datetime.date(2024, 1, 1),
+            journal="VE",
+            account="411",
+            label="test",
+            debit=0.1,
+            credit=0.0,
+            piece_number="X",
+            lettrage="X",
+            channel="shopify",
+            entry_type="sale",
+        )
+        entries = [line] * 10 + [dataclasses.replace(line, account="707", debit=0.0, credit=1.0)]
+        verify_balance(entries)  # should not raise
+
+    def test_unbalanced_message_in_euros(self) -> None:
+        """Le message d'erreur affiche les totaux en euros."""
+        line = AccountingEntry(
+            date=datetime.date(2024, 1, 1),
+            journal="VE",
+            account="411",
+            label="test",
+            debit=100.0,
+            credit=0.0,
+            piece_number="X",
+            lettrage="X",
+            channel="shopify",
+            entry_type="sale",
+        )
+        entries = [line, dataclasses.replace(line, account="707", debit=0.0, credit=99.99)]
+        with pytest.raises(BalanceError, match=r"débit=100\.0, crédit=99\.99"):
+            verify_balance(entries)
+
+
+class TestToCents:
+    """Tests de to_cents()."""
+
+    def test_positive(self) -> None:
+        assert to_cents(19.99) == 1999
+
+    def test_negative(self) -> None:
+        assert to_cents(-0.1) == -10
+
+    def test_float_representation_error(self) -> None:
+        """0.29 * 100 = 28.999999999999996 en flottant → 29 centimes."""
+        assert to_cents(0.29) == 29
+
+
+class TestSplitSigned:
+    """Tests de split_signed()."""
+
+    def test_positive_is_debit(self) -> None:
+        assert split_signed(19.99) == (19.99, 0.0)
+
+    def test_negative_is_credit(self) -> None:
+        assert split_signed(-5.5) == (0.0, 5.5)
+
+    def test_zero(self) -> None:
+        """Zéro → (0.0, 0.0), sans -0.0 côté crédit."""
+        debit, credit = split_signed(0.0)
+        assert (debit, credit) == (0.0, 0.0)
+        assert str(credit) == "0.0"
+
+
+class TestBuildTransitPair:
+    """Tests de build_transit_pair()."""
+
+    def _pair(self, amount: float) -> list[AccountingEntry]:
+        return build_transit_pair(
+            date=datetime.date(2024, 1, 20),
+            journal="RG",
+            transit_account="58000000",
+            counterpart_account="51150007",
+            amount=amount,
+            label="Reversement card 2024-01-20",
+            piece_number="P001",
+            channel="shopify",
+        )
+
+    def test_positive_amount_debits_transit(self) -> None:
+        transit, counterpart = self._pair(150.0)
+        assert (transit.account, transit.debit, transit.credit) == ("58000000", 150.0, 0.0)
+        assert (counterpart.account, counterpart.debit, counterpart.credit) == ("51150007", 0.0, 150.0)
+
+    def test_negative_amount_credits_transit(self) -> None:
+        transit, counterpart = self._pair(-42.5)
+        assert (transit.debit, transit.credit) == (0.0, 42.5)
+        assert (counterpart.debit, counterpart.credit) == (42.5, 0.0)
+
+    def test_lettrage_on_counterpart_only(self) -> None:
+        transit, counterpart = self._pair(10.0)
+        assert transit.lettrage == ""
+        assert counterpart.lettrage == "P001"
+        assert transit.entry_type == counterpart.entry_type == "payout"
+
 
 class TestIndexToLetter:
     """Tests de _index_to_letter()."""
@@ -100,6 +100,45 @@ class TestExportNominal:
         assert isinstance(date_cell.value, datetime.datetime)
         wb.close()
 
+    def test_dates_iso_format(self, tmp_path: Path, sample_config: AppConfig) -> None:
+        """Les cellules date portent le format d'affichage YYYY-MM-DD."""
+        output = tmp_path / "output.xlsx"
+
+        export([_make_entry()], [], output, sample_config)
+
+        wb = openpyxl.load_workbook(output)
+        date_cell = wb["Écritures"].cell(row=2, column=1)
+        assert date_cell.value == datetime.datetime(2026, 1, 15)
+        assert date_cell.number_format == "YYYY-MM-DD"
+        wb.close()
+
+    def test_entry_values_in_column_order(self, tmp_path: Path, sample_config: AppConfig) -> None:
+        """Chaque ligne reprend les champs de l'écriture dans l'ordre des colonnes."""
+        entry = _make_entry(debit=12.5, credit=0.0, lettrage="")
+        output = tmp_path / "output.xlsx"
+
+        export([entry], [], output, sample_config)
+
+        wb = openpyxl.load_workbook(output)
+        values = [cell.value for cell in wb["Écritures"][2]]
+        assert values[1:] == ["VE", "70701250", "Vente #001 Shopify", 12.5, 0, "#001", None, "shopify", "sale"]
+        wb.close()
+
+    def test_url_and_formula_like_text_stays_plain(self, tmp_path: Path, sample_config: AppConfig) -> None:
+        """Libellés ressemblant à une URL ou une formule → texte brut, sans lien ni formule."""
+        entries = [_make_entry(label="https://example.com/x"), _make_entry(label="=1+1")]
+        output = tmp_path / "output.xlsx"
+
+        export(entries, [], output, sample_config)
+
+        wb = openpyxl.load_workbook(output)
+        ws = wb["Écritures"]
+        cells = [ws.cell(row=row, column=4) for row in (2, 3)]
+        assert [cell.value for cell in cells] == ["https://example.com/x", "=1+1"]
+        assert [cell.data_type for cell in cells] == ["s", "s"]
+        assert [cell.hyperlink for cell in cells] == [None, None]
+        wb.close()
+
 
 class TestExportAnomaliesEmpty:
     """Tests onglet Anomalies vide."""
@@ -137,6 +176,17 @@ class TestExportAnomaliesPopulated:
         assert len(data_rows) == 2
         wb.close()
 
+    def test_none_values_left_empty(self, tmp_path: Path, sample_config: AppConfig) -> None:
+        """expected_value / actual_value à None → cellules vides."""
+        output = tmp_path / "output.xlsx"
+
+        export([], [_make_anomaly(actual_value="42.0")], output, sample_config)
+
+        wb = openpyxl.load_workbook(output)
+        row = [cell.value for cell in wb["Anomalies"][2]]
+        assert row[-2:] == [None, "42.0"]
+        wb.close()
+
 
 class TestPrintSummary:
     """Tests du résumé console."""
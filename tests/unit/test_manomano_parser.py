@@ -53,6 +53,13 @@ def _make_payout_df(rows: list[dict[str, object]] | None = None) -> pd.DataFrame
     return pd.DataFrame(rows)
 
 
+def _make_coerced_payout_df(rows: list[dict[str, object]] | None = None) -> pd.DataFrame:
+    """Crée un DataFrame Versements aux colonnes converties, tel que parse() le transmet."""
+    df = _make_payout_df(rows)
+    ManoManoParser._coerce_payout_columns(df)
+    return df
+
+
 def _write_csv(df: pd.DataFrame, path: Path) -> None:
     """Écrit un DataFrame en CSV avec séparateur ';'."""
     df.to_csv(path, sep=";", index=False)
@@ -230,6 +237,23 @@ class TestParseCA:
         assert rows[0]["date"] is None
         assert len(anomalies) == 0
 
+    def test_extra_columns_ignored(self, sample_config: AppConfig, tmp_path: Path) -> None:
+        """Colonnes hors CA_REQUIRED_COLUMNS (exports réels) → ignorées, alias createdAt conservé."""
+        # Arrange
+        df = _make_ca_df(sellerName="Vendeur", productTitle="Perceuse")
+        df = df.rename(columns={"createdAt": "operationDate"})
+        ca_path = tmp_path / "ca.csv"
+        _write_csv(df, ca_path)
+        parser = ManoManoParser()
+
+        # Act
+        rows, anomalies = parser._parse_ca(ca_path, sample_config)
+
+        # Assert
+        assert len(rows) == 1
+        assert rows[0]["date"] == datetime.date(2026, 1, 15)
+        assert len(anomalies) == 0
+
 
 # =============================================================================
 # Tâche 5 : Tests parsing Versements
@@ -242,7 +266,7 @@ class TestParsePayouts:
     def test_nominal_order_refund_lookup(self, sample_config: AppConfig) -> None:
         """ORDER + REFUND → lookup_dict correct."""
         # Arrange
-        df = _make_payout_df([
+        df = _make_coerced_payout_df([
             {"REFERENCE": "M001", "TYPE": "ORDER", "PAYOUT_REFERENCE": "PAY001", "PAYOUT_DATE": "2026-01-31", "AMOUNT": 102.00},
             {"REFERENCE": "M002", "TYPE": "REFUND", "PAYOUT_REFERENCE": "PAY001", "PAYOUT_DATE": "2026-01-31", "AMOUNT": -50.00},
         ])
@@ -261,7 +285,7 @@ class TestParsePayouts:
     def test_special_adjustment(self, sample_config: AppConfig) -> None:
         """ADJUSTMENT → special_type='ADJUSTMENT', montants classiques à 0.00, net_amount signé."""
         # Arrange
-        df = _make_payout_df([
+        df = _make_coerced_payout_df([
             {"REFERENCE": "ADJ001", "TYPE": "ADJUSTMENT", "PAYOUT_REFERENCE": "PAY001", "PAYOUT_DATE": "2026-01-31", "AMOUNT": -5.50},
         ])
         parser = ManoManoParser()
@@ -278,7 +302,7 @@ class TestParsePayouts:
 
     def test_special_eco_contribution(self, sample_config: AppConfig) -> None:
         """ECO_CONTRIBUTION → special_type correct."""
-        df = _make_payout_df([
+        df = _make_coerced_payout_df([
             {"REFERENCE": "ECO001", "TYPE": "ECO_CONTRIBUTION", "PAYOUT_REFERENCE": "PAY001", "PAYOUT_DATE": "2026-01-31", "AMOUNT": -2.00},
         ])
         parser = ManoManoParser()
@@ -287,7 +311,7 @@ class TestParsePayouts:
 
     def test_special_subscription(self, sample_config: AppConfig) -> None:
         """SUBSCRIPTION → special_type correct."""
-        df = _make_payout_df([
+        df = _make_coerced_payout_df([
             {"REFERENCE": "SUB001", "TYPE": "SUBSCRIPTION", "PAYOUT_REFERENCE": "PAY001", "PAYOUT_DATE": "2026-01-31", "AMOUNT": -39.90},
         ])
         parser = ManoManoParser()
@@ -296,7 +320,7 @@ class TestParsePayouts:
 
     def test_special_refund_penalty(self, sample_config: AppConfig) -> None:
         """REFUND_PENALTY → special_type correct."""
-        df = _make_payout_df([
+        df = _make_coerced_payout_df([
             {"REFERENCE": "PEN001", "TYPE": "REFUND_PENALTY", "PAYOUT_REFERENCE": "PAY001", "PAYOUT_DATE": "2026-01-31", "AMOUNT": -10.00},
         ])
         parser = ManoManoParser()
@@ -305,7 +329,7 @@ class TestParsePayouts:
 
     def test_unknown_payout_type(self, sample_config: AppConfig) -> None:
         """Type inconnu Versements → Anomaly(type='unknown_payout_type'), ligne ignorée."""
-        df = _make_payout_df([
+        df = _make_coerced_payout_df([
             {"REFERENCE": "X001", "TYPE": "MARKETING_FEE", "PAYOUT_REFERENCE": "PAY001", "PAYOUT_DATE": "2026-01-31", "AMOUNT": -15.00},
         ])
         parser = ManoManoParser()
@@ -317,7 +341,7 @@ class TestParsePayouts:
 
     def test_missing_column_payout(self, sample_config: AppConfig) -> None:
         """Colonne manquante Versements → ParseError."""
-        df = _make_payout_df()
+        df = _make_coerced_payout_df()
         df = df.drop(columns=["AMOUNT"])
         parser = ManoManoParser()
         with pytest.raises(ParseError, match="AMOUNT"):
@@ -325,7 +349,7 @@ class TestParsePayouts:
 
     def test_invalid_payout_date(self, sample_config: AppConfig) -> None:
         """PAYOUT_DATE invalide → Anomaly(type='invalid_date'), ligne ignorée."""
-        df = _make_payout_df([
+        df = _make_coerced_payout_df([
             {"REFERENCE": "M001", "TYPE": "ORDER", "PAYOUT_REFERENCE": "PAY001", "PAYOUT_DATE": "not-a-date", "AMOUNT": 102.00},
         ])
         parser = ManoManoParser()
@@ -334,9 +358,32 @@ class TestParsePayouts:
         assert len(anomalies) == 1
         assert anomalies[0].type == "invalid_date"
 
+    def test_raw_payout_frame_rejected(self, sample_config: AppConfig) -> None:
+        """PAYOUT_DATE non converti → AssertionError explicite dans les deux helpers."""
+        df = _make_payout_df()
+        parser = ManoManoParser()
+        with pytest.raises(AssertionError, match="PAYOUT_DATE"):
+            parser._parse_payout_lines(df, sample_config)
+        with pytest.raises(AssertionError, match="PAYOUT_DATE"):
+            parser._aggregate_payout_summaries(df)
+
+    def test_coerce_payout_columns(self) -> None:
+        """Conversion en place : AMOUNT numérique, PAYOUT_DATE datetime, valeurs invalides → NaN/NaT."""
+        df = _make_payout_df([
+            {"REFERENCE": "M001", "TYPE": "ORDER", "PAYOUT_REFERENCE": "PAY001", "PAYOUT_DATE": "2026-01-31", "AMOUNT": "102.5"},
+            {"REFERENCE": "M002", "TYPE": "ORDER", "PAYOUT_REFERENCE": "PAY001", "PAYOUT_DATE": "bad", "AMOUNT": "abc"},
+        ])
+
+        ManoManoParser._coerce_payout_columns(df)
+
+        assert df["AMOUNT"].iloc[0] == 102.5
+        assert pd.isna(df["AMOUNT"].iloc[1])
+        assert df["PAYOUT_DATE"].iloc[0] == pd.Timestamp(2026, 1, 31)
+        assert pd.isna(df["PAYOUT_DATE"].iloc[1])
+
     def test_payout_summary_simple(self, sample_config: AppConfig) -> None:
         """3 lignes même PAYOUT_REFERENCE → 1 PayoutSummary, total_amount = somme signée."""
-        df = _make_payout_df([
+        df = _make_coerced_payout_df([
             {"REFERENCE": "M001", "TYPE": "ORDER", "PAYOUT_REFERENCE": "PAY001", "PAYOUT_DATE": "2026-01-31", "AMOUNT": 102.00},
             {"REFERENCE": "M002", "TYPE": "REFUND", "PAYOUT_REFERENCE": "PAY001", "PAYOUT_DATE": "2026-01-31", "AMOUNT": -50.00},
             {"REFERENCE": "ADJ001", "TYPE": "ADJUSTMENT", "PAYOUT_REFERENCE": "PAY001", "PAYOUT_DATE": "2026-01-31", "AMOUNT": -5.00},
@@ -359,7 +406,7 @@ class TestParsePayouts:
 
     def test_payout_summary_multiple_payouts(self, sample_config: AppConfig) -> None:
         """2 PAYOUT_REFERENCE distincts → 2 PayoutSummary séparés."""
-        df = _make_payout_df([
+        df = _make_coerced_payout_df([
             {"REFERENCE": "M001", "TYPE": "ORDER", "PAYOUT_REFERENCE": "PAY001", "PAYOUT_DATE": "2026-01-31", "AMOUNT": 100.00},
             {"REFERENCE": "M002", "TYPE": "ORDER", "PAYOUT_REFERENCE": "PAY002", "PAYOUT_DATE": "2026-02-15", "AMOUNT": 200.00},
         ])
@@ -373,7 +420,7 @@ class TestParsePayouts:
 
     def test_payout_summary_invalid_date(self, sample_config: AppConfig) -> None:
         """PAYOUT_DATE invalide dans aggregate → Anomaly, payout ignoré."""
-        df = _make_payout_df([
+        df = _make_coerced_payout_df([
             {"REFERENCE": "M001", "TYPE": "ORDER", "PAYOUT_REFERENCE": "PAY001", "PAYOUT_DATE": "bad-date", "AMOUNT": 100.00},
         ])
         parser = ManoManoParser()
@@ -382,6 +429,22 @@ class TestParsePayouts:
         assert len(anomalies) == 1
         assert anomalies[0].type == "invalid_date"
 
+    def test_payout_summary_date_from_first_row(self, sample_config: AppConfig) -> None:
+        """Date du groupe = celle de sa première ligne, même invalide ; PAYOUT_REFERENCE vide ignorée."""
+        df = _make_coerced_payout_df([
+            {"REFERENCE": "M001", "TYPE": "ORDER", "PAYOUT_REFERENCE": "PAY001", "PAYOUT_DATE": "bad-date", "AMOUNT": 100.00},
+            {"REFERENCE": "M002", "TYPE": "ORDER", "PAYOUT_REFERENCE": "PAY001", "PAYOUT_DATE": "2026-01-31", "AMOUNT": 50.00},
+            {"REFERENCE": "M003", "TYPE": "ORDER", "PAYOUT_REFERENCE": "PAY002", "PAYOUT_DATE": "2026-02-15", "AMOUNT": 20.00},
+            {"REFERENCE": "M004", "TYPE": "ORDER", "PAYOUT_REFERENCE": "PAY002", "PAYOUT_DATE": "2026-02-20", "AMOUNT": 10.00},
+            {"REFERENCE": "M005", "TYPE": "ORDER", "PAYOUT_REFERENCE": None, "PAYOUT_DATE": "2026-03-01", "AMOUNT": 5.00},
+        ])
+        parser = ManoManoParser()
+        summaries, anomalies = parser._aggregate_payout_summaries(df)
+        assert [(a.type, a.reference) for a in anomalies] == [("invalid_date", "PAY001")]
+        assert [(s.payout_reference, s.payout_date, s.total_amount) for s in summaries] == [
+            ("PAY002", datetime.date(2026, 2, 15), 30.00),
+        ]
+
 
 # =============================================================================
 # Tâche 7 : Tests matching + ParseResult
@@ -671,6 +734,27 @@ class TestOrderDetailsLookup:
         assert len(conflict_anomalies) == 1
         assert conflict_anomalies[0].reference == "M001"
 
+    def test_country_conflicts_multiple_orders(self, sample_config: AppConfig, tmp_path: Path) -> None:
+        """Plusieurs commandes en conflit → une anomalie chacune, valeurs dans l'ordre d'apparition."""
+        # Arrange
+        df = pd.DataFrame({
+            "Order Reference": ["M002", "M001", "M003", "M002", "M001", "M002"],
+            "Billing Country ISO": ["IT", "FR", "FR", "DE", "DE", "FR"],
+        })
+        od_path = tmp_path / "od.csv"
+        _write_csv(df, od_path)
+        parser = ManoManoParser()
+
+        # Act
+        lookup, anomalies = parser._parse_order_details(od_path, sample_config)
+
+        # Assert
+        assert lookup == {"M002": "380", "M001": "250", "M003": "250"}
+        conflicts = [a for a in anomalies if a.type == "country_conflict"]
+        assert [a.reference for a in conflicts] == ["M001", "M002"]
+        assert conflicts[0].actual_value == "['FR', 'DE']"
+        assert conflicts[1].actual_value == "['IT', 'DE', 'FR']"
+
     def test_unknown_alpha2(self, sample_config: AppConfig, tmp_path: Path) -> None:
         """Alpha-2 inconnu → Anomaly(type='unknown_country_alpha2') + absence du lookup."""
         # Arrange
@@ -904,8 +988,9 @@ class TestAmountVatExclAlias:
             },
         ])
         parser = ManoManoParser()
-        # apply_column_aliases simulates what parse() does before _parse_payout_lines
+        # apply_column_aliases + _coerce_payout_columns simulate what parse() does before _parse_payout_lines
         df = parser.apply_column_aliases(df, {"AMOUNT": ["NET_AMOUNT"], "AMOUNT_HT": ["AMOUNT_VAT_EXCL"]})
+        parser._coerce_payout_columns(df)
         specials, _, anomalies = parser._parse_payout_lines(df, sample_config)
 
         assert len(specials) == 1
@@ -925,6 +1010,7 @@ class TestAmountVatExclAlias:
         ])
         parser = ManoManoParser()
         df = parser.apply_column_aliases(df, {"AMOUNT": ["NET_AMOUNT"], "AMOUNT_HT": ["AMOUNT_VAT_EXCL"]})
+        parser._coerce_payout_columns(df)
         specials, _, _ = parser._parse_payout_lines(df, sample_config)
 
         assert specials[0]["amount_ht"] == 17.13
@@ -941,6 +1027,7 @@ class TestAmountVatExclAlias:
         ])
         parser = ManoManoParser()
         df = parser.apply_column_aliases(df, {"AMOUNT": ["NET_AMOUNT"], "AMOUNT_HT": ["AMOUNT_VAT_EXCL"]})
+        parser._coerce_payout_columns(df)
         specials, _, _ = parser._parse_payout_lines(df, sample_config)
 
         assert specials[0]["amount_ht"] == 12.50
@@ -972,7 +1059,7 @@ class TestAmountVatExclAlias:
 
     def test_without_ht_column_fallback_zero(self, sample_config: AppConfig) -> None:
         """Sans colonne AMOUNT_HT ni AMOUNT_VAT_EXCL → amount_ht=0, amount_tva=0 (fallback TTC)."""
-        df = _make_payout_df([
+        df = _make_coerced_payout_df([
             {
                 "REFERENCE": "SUB001", "TYPE": "SUBSCRIPTION",
                 "PAYOUT_REFERENCE": "PAY001", "PAYOUT_DATE": "2026-01-31",
@@ -355,6 +355,30 @@ class TestMiraklAggregation:
         assert len(anomalies) == 1
         assert anomalies[0].type == "missing_date"
 
+    def test_date_from_first_line(self) -> None:
+        """Date de commande = celle de la première ligne du groupe, même manquante."""
+        # Arrange
+        df = _make_order_df([
+            {"Numéro de commande": "CMD016", "Type": "Montant", "Date de commande": None,
+             "Montant": 100.00},
+            {"Numéro de commande": "CMD016", "Type": "Commission", "Date de commande": "2026-01-10",
+             "Montant": -10.00},
+            {"Numéro de commande": "CMD017", "Type": "Montant", "Date de commande": "2026-01-10",
+             "Montant": 50.00},
+            {"Numéro de commande": "CMD017", "Type": "Commission", "Date de commande": "2026-01-12",
+             "Montant": -5.00},
+        ])
+        parser = MiraklParser(channel="decathlon")
+
+        # Act
+        orders, anomalies = _aggregate_orders_helper(parser, df, tva_rate=20.0, country_code="250")
+
+        # Assert
+        assert [(a.type, a.reference) for a in anomalies] == [("missing_date", "CMD016")]
+        assert [(o["reference"], o["date"], o["commission_ht"]) for o in orders] == [
+            ("CMD017", datetime.date(2026, 1, 10), -5.00),
+        ]
+
 
 # ---------------------------------------------------------------------------
 # Helpers for payments/subscriptions
@@ -445,6 +469,31 @@ class TestMiraklPayments:
         assert len(anomalies) == 1
         assert anomalies[0].type == "invalid_date"
 
+    def test_payment_mixed_rows(self) -> None:
+        """Lignes valides, sans référence et sans date → lookup et anomalies cohérents."""
+        # Arrange
+        df = _make_payment_df([
+            {"Numéro de commande": "CMD001", "Type": "Paiement",
+             "Date du cycle de paiement": "2026-01-20", "Montant": 150.00},
+            {"Numéro de commande": "CMD002", "Type": "Paiement",
+             "Date du cycle de paiement": "invalid", "Montant": 80.00},
+            {"Numéro de commande": "  ", "Type": "Paiement",
+             "Date du cycle de paiement": "2026-01-20", "Montant": 20.00},
+            {"Numéro de commande": "CMD003", "Type": "Paiement",
+             "Date du cycle de paiement": "2026-01-27", "Montant": 40.00},
+        ])
+        parser = MiraklParser(channel="decathlon")
+
+        # Act
+        lookup, anomalies = parser._build_payment_lookup(df)
+
+        # Assert
+        assert lookup == {
+            "CMD001": (datetime.date(2026, 1, 20), "2026-01-20"),
+            "CMD003": (datetime.date(2026, 1, 27), "2026-01-27"),
+        }
+        assert [(a.type, a.reference) for a in anomalies] == [("invalid_date", "CMD002")]
+
     def test_payout_summary_same_cycle(self) -> None:
         """2 lignes Paiement même cycle → 1 PayoutSummary, total correct."""
         # Arrange
@@ -925,6 +974,46 @@ class TestMiraklCommon:
         assert len(order_txs) == 1
         assert order_txs[0].reference == "CMD201"
 
+    @pytest.mark.parametrize("channel", ["decathlon", "leroy_merlin"])
+    def test_parse_extra_columns_ignored(self, tmp_path, sample_config, channel: str) -> None:
+        """Colonnes non utilisées (exports réels) ignorées ; en-têtes avec espaces et alias reconnus."""
+        # Arrange
+        csv_path = _write_csv(tmp_path, "test.csv", [
+            {" Numéro de commande ": "CMD300", "Type": "Montant", "Date de création": "2026-01-15",
+             "Date du cycle de paiement": "", "Montant": "100.00", "Libellé": "Vente", "Devise": "EUR"},
+        ])
+        parser = MiraklParser(channel=channel)
+
+        # Act
+        result = parser.parse(files={"data": csv_path}, config=sample_config)
+
+        # Assert
+        assert len(result.transactions) == 1
+        assert result.transactions[0].reference == "CMD300"
+        assert result.transactions[0].date == datetime.date(2026, 1, 15)
+
+    @pytest.mark.parametrize("channel", ["decathlon", "leroy_merlin"])
+    def test_parse_dates_iso_and_dayfirst(self, tmp_path, sample_config, channel: str) -> None:
+        """Dates ISO (jour ≤ 12) non inversées ; format jj/mm/aaaa - hh:mm:ss lu jour en premier."""
+        # Arrange
+        csv_path = _write_csv(tmp_path, "test.csv", [
+            {"Numéro de commande": "CMD400", "Type": "Montant", "Date de commande": "2026-01-05",
+             "Date du cycle de paiement": "", "Montant": "100.00"},
+            {"Numéro de commande": "CMD401", "Type": "Montant", "Date de commande": "06/02/2026 - 10:00:00",
+             "Date du cycle de paiement": "", "Montant": "50.00"},
+        ])
+        parser = MiraklParser(channel=channel)
+
+        # Act
+        result = parser.parse(files={"data": csv_path}, config=sample_config)
+
+        # Assert
+        dates = {t.reference: t.date for t in result.transactions}
+        assert dates == {
+            "CMD400": datetime.date(2026, 1, 5),
+            "CMD401": datetime.date(2026, 2, 6),
+        }
+
 
 class TestMiraklPaymentEdgeCases:
     """Tests pour les cas limites des paiements."""
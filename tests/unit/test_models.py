@@ -15,6 +15,7 @@ from compta_ecom.models import (
     ParseError,
     ParseResult,
     PayoutSummary,
+    channel_display_name,
 )
 
 
@@ -250,3 +251,19 @@ class TestExceptionHierarchy:
 
         err3 = BalanceError("déséquilibre")
         assert str(err3) == "déséquilibre"
+
+
+class TestChannelDisplayName:
+    def test_explicit_display_name(self) -> None:
+        assert channel_display_name("manomano") == "ManoMano"
+
+    def test_derived_display_name(self) -> None:
+        assert channel_display_name("leroy_merlin") == "Leroy Merlin"
+
+    def test_repeated_calls_hit_cache(self) -> None:
+        """Le second appel sur le même canal est servi par le cache."""
+        channel_display_name.cache_clear()
+        assert channel_display_name("decathlon") == "Decathlon"
+        assert channel_display_name("decathlon") == "Decathlon"
+        info = channel_display_name.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
@@ -590,3 +590,29 @@ class TestChannelErrors:
         tx = _make_transaction(channel="amazon")
         with pytest.raises(KeyError):
             generate_sale_entries(tx, sample_config)
+
+
+class TestAccountCache:
+    """Cache des comptes résolus partagé sur une génération."""
+
+    def test_cache_filled_and_reused(self, sample_config: AppConfig) -> None:
+        """Même (canal, pays, port) → comptes résolus une seule fois, écritures identiques."""
+        cache: dict[tuple[str, str, bool], dict[str, str]] = {}
+        first = generate_sale_entries(_make_transaction(), sample_config, cache)
+        second = generate_sale_entries(_make_transaction(reference="#1119"), sample_config, cache)
+
+        assert list(cache) == [("shopify", "250", False)]
+        assert [e.account for e in first] == [e.account for e in second]
+        assert first == generate_sale_entries(_make_transaction(), sample_config)
+
+    def test_shipping_is_part_of_key(self, sample_config: AppConfig) -> None:
+        """Une vente avec port n'utilise pas l'entrée de cache sans compte port."""
+        cache: dict[tuple[str, str, bool], dict[str, str]] = {}
+        generate_sale_entries(_make_transaction(), sample_config, cache)
+        tx = _make_transaction(
+            amount_ht=100.0, shipping_ht=10.0, shipping_tva=2.0, amount_tva=20.0, amount_ttc=132.0
+        )
+        entries = generate_sale_entries(tx, sample_config, cache)
+
+        assert ("shopify", "250", True) in cache
+        assert any(e.account == cache[("shopify", "250", True)]["port"] for e in entries)